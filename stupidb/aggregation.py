@@ -4,8 +4,8 @@ from __future__ import annotations
 
 import abc
 import bisect
+import collections
 import enum
-import functools
 import typing
 from typing import (
     Any,
@@ -18,9 +18,8 @@ from typing import (
     TypeVar,
 )
 
-import toolz
-
 from .aggregator import Aggregate, Aggregator
+from .columnar import argsort, columns_getter, getter_columns
 from .functions.associative import BinaryAssociativeAggregate, UnaryAssociativeAggregate
 from .functions.navigation import (
     BinaryNavigationAggregate,
@@ -123,21 +122,32 @@ class FrameClause(abc.ABC):
 
         """
 
-    @abc.abstractmethod
     def setup_window(
         self,
         possible_peers: Sequence[AbstractRow],
-        current_row: AbstractRow,
         order_by_columns: Sequence[str],
-    ) -> tuple[OrderingKey, Sequence[OrderingKey]]:
-        """Compute the current row's ordering keys."""
+    ) -> Sequence[OrderingKey]:
+        """Compute the ordering keys of every row in a partition.
+
+        This is called once per partition, so that computing the frame of each
+        row doesn't have to revisit every one of its possible peers.
+
+        Parameters
+        ----------
+        possible_peers
+            The sorted rows of a partition.
+        order_by_columns
+            The columns by which we have ordered our window, if any.
+
+        """
+        return list(map(columns_getter(order_by_columns), possible_peers))
 
     def compute_window_frame(
         self,
         possible_peers: Sequence[AbstractRow],
         current_row: AbstractRow,
         row_id_in_partition: int,
-        order_by_columns: Sequence[str],
+        order_by_values: Sequence[OrderingKey],
     ) -> StartStop:
         """Compute the bounds of the window frame.
 
@@ -149,8 +159,9 @@ class FrameClause(abc.ABC):
             The row relative to which we are computing the window.
         row_id_in_partition
             The zero-based index of `current_row` in possible_peers.
-        order_by_columns
-            The columns by which we have ordered our window, if any.
+        order_by_values
+            The ordering keys of `possible_peers`, as computed by
+            :meth:`setup_window`.
 
         Returns
         -------
@@ -158,9 +169,7 @@ class FrameClause(abc.ABC):
             The start and stop of the window frame.
 
         """
-        current_row_order_by_value, order_by_values = self.setup_window(
-            possible_peers, current_row, order_by_columns
-        )
+        current_row_order_by_value = order_by_values[row_id_in_partition]
 
         preceding = self.preceding
         if preceding is not None:
@@ -183,7 +192,7 @@ class FrameClause(abc.ABC):
                 order_by_values,
             )
         else:
-            if not all(order_by_values):
+            if not current_row_order_by_value:
                 # if we don't have an order by then all possible peers are the
                 # actual peers of this row
                 stop = npeers
@@ -235,17 +244,6 @@ class RowsMode(FrameClause):
         assert following is not None, "following is None"
         return row_id_in_partition + typing.cast(int, following(current_row)) + 1
 
-    def setup_window(
-        self,
-        possible_peers: Sequence[AbstractRow],
-        current_row: AbstractRow,
-        order_by_columns: Sequence[str],
-    ) -> tuple[OrderingKey, Sequence[OrderingKey]]:  # noqa: D102
-        cols = [
-            tuple(map(peer.__getitem__, order_by_columns)) for peer in possible_peers
-        ]
-        return tuple(map(current_row.__getitem__, order_by_columns)), cols
-
 
 class RangeMode(FrameClause):
     """A frame clause implementation for window function ``RANGE`` mode.
@@ -280,19 +278,12 @@ class RangeMode(FrameClause):
     def setup_window(
         self,
         possible_peers: Sequence[AbstractRow],
-        current_row: AbstractRow,
         order_by_columns: Sequence[str],
-    ) -> tuple[OrderingKey, Sequence[OrderingKey]]:  # noqa: D102
+    ) -> Sequence[OrderingKey]:  # noqa: D102
         # range mode allows no order by
-        if not order_by_columns:
-            return (), [()]
-
         ncolumns = len(order_by_columns)
-        assert ncolumns == 1, f"ncolumns == {ncolumns:d}"
-        (order_by_column,) = order_by_columns
-        order_by_values = [(peer[order_by_column],) for peer in possible_peers]
-        current_row_order_by_value = (current_row[order_by_column],)
-        return current_row_order_by_value, order_by_values
+        assert ncolumns <= 1, f"ncolumns == {ncolumns:d}"
+        return super().setup_window(possible_peers, order_by_columns)
 
     def find_partition_begin(
         self,
@@ -400,6 +391,9 @@ class AggregateSpecification(Generic[ConcreteAggregate]):
         The aggregate class to use for aggregation.
     getters
         A tuple of callables used to produce the arguments for the aggregation.
+    columns
+        The names of the columns looked up by `getters`, or :data:`None` if
+        any of them is not a plain column lookup.
 
     See Also
     --------
@@ -407,7 +401,7 @@ class AggregateSpecification(Generic[ConcreteAggregate]):
 
     """
 
-    __slots__ = "aggregate_type", "getters"
+    __slots__ = "aggregate_type", "getters", "columns"
 
     def __init__(
         self,
@@ -416,8 +410,10 @@ class AggregateSpecification(Generic[ConcreteAggregate]):
     ) -> None:
         self.aggregate_type: type[ConcreteAggregate] = aggregate_type
         self.getters = getters
+        self.columns = getter_columns(getters)
 
 
+# The NULL-aware ordering that columnar.argsort implements (see test_argsort).
 def row_key_compare(
     order_func: Callable[[AbstractRow], tuple[Comparable[T], ...]],
     null_ordering: Nulls,
@@ -448,23 +444,11 @@ def row_key_compare(
     return 0
 
 
-def make_key_func(
-    order_func: Callable[[AbstractRow], tuple[Comparable[T], ...]],
-    nulls: Nulls,
-) -> Callable[[AbstractRow], OrderingKey[T]]:
-    """Make a function usable with the key argument to sorting functions.
-
-    This return value of this function can be passed to
-    :func:`sorted`/:meth:`list.sort`.
-
-    Parameters
-    ----------
-    order_by_columns
-        A sequence of :class:`str` instances referring to the keys of an
-        :class:`~stupidb.row.AbstractRow`.
-
-    """
-    return functools.cmp_to_key(functools.partial(row_key_compare, order_func, nulls))
+def juxt(
+    funcs: Sequence[Callable[[AbstractRow], Any]]
+) -> Callable[[AbstractRow], tuple[Any, ...]]:
+    """Return a function that calls every function in `funcs` on a row."""
+    return lambda row: tuple(func(row) for func in funcs)
 
 
 class WindowAggregateSpecification(Generic[ConcreteAggregate]):
@@ -483,6 +467,14 @@ class WindowAggregateSpecification(Generic[ConcreteAggregate]):
         BY`` (:attr:`stupidb.aggregation.FrameClause.order_by`), ``PARTITION
         BY`` (:attr:`stupidb.aggregation.FrameClause.partition_by`) and
         preceding and following.
+    partition_by_columns
+        The names of the columns looked up by the ``PARTITION BY`` functions of
+        `frame_clause`, or :data:`None` if any of them is not a plain column
+        lookup.
+    order_by_columns
+        The names of the columns looked up by the ``ORDER BY`` functions of
+        `frame_clause`, or :data:`None` if any of them is not a plain column
+        lookup.
 
     See Also
     --------
@@ -490,7 +482,13 @@ class WindowAggregateSpecification(Generic[ConcreteAggregate]):
 
     """
 
-    __slots__ = "aggregate_type", "getters", "frame_clause"
+    __slots__ = (
+        "aggregate_type",
+        "getters",
+        "frame_clause",
+        "partition_by_columns",
+        "order_by_columns",
+    )
 
     def __init__(
         self,
@@ -501,6 +499,8 @@ class WindowAggregateSpecification(Generic[ConcreteAggregate]):
         self.aggregate_type: type[ConcreteAggregate] = aggregate_type
         self.getters = getters
         self.frame_clause = frame_clause
+        self.partition_by_columns = getter_columns(frame_clause.partition_by)
+        self.order_by_columns = getter_columns(frame_clause.order_by)
 
     def compute(self, rows: Iterable[AbstractRow]) -> Iterator[T | None]:
         """Aggregate `rows` over a window, producing an iterator of results.
@@ -514,20 +514,19 @@ class WindowAggregateSpecification(Generic[ConcreteAggregate]):
         frame_clause = self.frame_clause
         order_by = frame_clause.order_by
 
-        # Generate names for temporary order by columns, users never see these.
-        #
-        # TODO: If we had static schema information these wouldn't be necessary
-        # in cases where the ordering keys are named columns (either physical
-        # or computed)
-        order_by_columns = [f"_order_by_{i:d}" for i in range(len(order_by))]
-
-        # Add computed order by columns that are used when evaluating window
-        # functions in range mode
-        # TODO: check that if in range mode we only have single order by
-        order_func = toolz.juxt(*order_by)
-        rows_for_partition = (
-            row.merge(dict(zip(order_by_columns, order_func(row)))) for row in rows
-        )
+        order_by_columns = self.order_by_columns
+        if order_by_columns is None:
+            # Generate names for temporary order by columns, users never see
+            # these.
+            order_by_columns = [f"_order_by_{i:d}" for i in range(len(order_by))]
+
+            # Add computed order by columns that are used when evaluating
+            # window functions in range mode
+            # TODO: check that if in range mode we only have single order by
+            order_func = juxt(order_by)
+            rows = (
+                row.merge(dict(zip(order_by_columns, order_func(row)))) for row in rows
+            )
 
         # divide the input rows into partitions
         #
@@ -537,10 +536,15 @@ class WindowAggregateSpecification(Generic[ConcreteAggregate]):
         #
         # we also only need the partition values once the rows have
         # been partitioned
-        partitions = toolz.groupby(
-            toolz.compose(hash, toolz.juxt(*frame_clause.partition_by)),
-            rows_for_partition,
-        ).values()
+        partition_by_columns = self.partition_by_columns
+        if partition_by_columns is None:
+            partition_func = juxt(frame_clause.partition_by)
+        else:
+            partition_func = columns_getter(partition_by_columns)
+        groups: dict[int, list[AbstractRow]] = collections.defaultdict(list)
+        for row in rows:
+            groups[hash(partition_func(row))].append(row)
+        partitions = groups.values()
 
         # aggregation results, preallocated to avoid the need to sort
         # before returning: we later assign elements to this list using
@@ -550,10 +554,50 @@ class WindowAggregateSpecification(Generic[ConcreteAggregate]):
         # Aggregate over each partition
         aggregate_type = self.aggregate_type
         getters = self.getters
-        key_func = make_key_func(order_func, frame_clause.nulls)
+        order_by_key = columns_getter(order_by_columns)
+        nulls_first = frame_clause.nulls is Nulls.FIRST
+
+        # Without an ORDER BY or any bounds every row's frame is its entire
+        # partition, so an associative aggregate has the same value for every
+        # row in a partition. Navigation and ranking functions keep track of
+        # the current row between queries, so they're always queried per row.
+        whole_partition = (
+            not order_by
+            and frame_clause.preceding is None
+            and frame_clause.following is None
+            and issubclass(
+                aggregate_type, (UnaryAssociativeAggregate, BinaryAssociativeAggregate)
+            )
+        )
         for possible_peers in partitions:
             # sort the partition according to the ordering key
-            possible_peers.sort(key=key_func)
+            if order_by:
+                indices = argsort(
+                    list(map(order_by_key, possible_peers)), nulls_first=nulls_first
+                )
+                possible_peers[:] = [possible_peers[index] for index in indices]
+
+            values = aggregate_type.partition_values(possible_peers, getters)
+            if values is not None:
+                for row, value in zip(possible_peers, values):
+                    results[row._id] = value
+                continue
+
+            # Every row's frame is the whole partition, so there's no need for
+            # a segment tree: a single aggregate stepped through the argument
+            # columns computes the one value every row gets
+            if whole_partition:
+                associative_type = typing.cast(
+                    "type[UnaryAssociativeAggregate[Any, T]]", aggregate_type
+                )
+                aggregate = associative_type()
+                aggregate.step_batch(
+                    *(list(map(getter, possible_peers)) for getter in getters)
+                )
+                value = aggregate.finalize()
+                for row in possible_peers:
+                    results[row._id] = value
+                continue
 
             # Construct an aggregator for the function being computed
             #
@@ -575,9 +619,12 @@ class WindowAggregateSpecification(Generic[ConcreteAggregate]):
             # For every row in the set of possible peers of the current row
             # compute the window frame, and query the aggregator for the value
             # of the aggregation within that frame.
+            order_by_values = frame_clause.setup_window(
+                possible_peers, order_by_columns
+            )
             for row_id_in_partition, row in enumerate(possible_peers):
                 start, stop = frame_clause.compute_window_frame(
-                    possible_peers, row, row_id_in_partition, order_by_columns
+                    possible_peers, row, row_id_in_partition, order_by_values
                 )
                 # Assign the result to the position of the original row id
                 # because we processed them in partition order, which might not
@@ -48,10 +48,26 @@ class Aggregate(Generic[Output], abc.ABC):
         order_by_columns: Sequence[str],
     ) -> Aggregator[Aggregate[Output], Output]:
         """Prepare an aggregation of this type for computation."""
-        arguments = [
-            tuple(getter(peer) for getter in getters) for peer in possible_peers
-        ]
-        return cls.aggregator_class(arguments)
+        # evaluate each argument over the whole partition, then zip the
+        # columns into rows of arguments
+        columns = [list(map(getter, possible_peers)) for getter in getters]
+        return cls.aggregator_class(list(zip(*columns)))
+
+    @classmethod
+    def partition_values(
+        cls,
+        possible_peers: Sequence[AbstractRow],
+        getters: tuple[Getter, ...],
+    ) -> Sequence[Output | None] | None:
+        """Compute the value of every row in a partition at once.
+
+        Functions whose result doesn't depend on the window frame, such as
+        `row_number` and `lead`/`lag` with the default offset, can override
+        this to skip computing a frame for every row. Return :data:`None` to
+        compute the aggregation frame by frame.
+
+        """
+        return None
 
     @classmethod
     @abc.abstractmethod
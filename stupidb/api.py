@@ -14,13 +14,16 @@
 
 from __future__ import annotations
 
+import builtins
+import datetime
+import decimal
+import functools
 import inspect
+import math
 import operator
 from typing import Any, Callable, Iterable, Mapping
 
 import tabulate
-import toolz
-from public import private, public
 
 from .aggregation import (
     AggregateSpecification,
@@ -28,8 +31,10 @@ from .aggregation import (
     Nulls,
     WindowAggregateSpecification,
 )
+from .columnar import conjunction, estimated_cost
 from .core import (
     Aggregation,
+    ColumnarTable,
     CrossJoin,
     Difference,
     DifferenceAll,
@@ -68,46 +73,181 @@ from .functions.associative import (
     Sum,
     Total,
 )
-from .functions.navigation import First, Lag, Last, Lead, Nth
+from .functions.navigation import (
+    First,
+    Lag,
+    Last,
+    Lead,
+    Nth,
+    default_offset,
+    default_value,
+)
 from .functions.ranking import DenseRank, Rank, RowNumber
 from .protocols import Comparable
 from .row import AbstractRow
 from .typehints import R1, R2, OrderBy, R, T
 
+__all__ = (
+    "const",
+    "get",
+    "table",
+    "cross_join",
+    "inner_join",
+    "left_join",
+    "right_join",
+    "full_join",
+    "order_by",
+    "select",
+    "mutate",
+    "sift",
+    "sift_all",
+    "exists",
+    "aggregate",
+    "over",
+    "group_by",
+    "union",
+    "union_all",
+    "intersect",
+    "intersect_all",
+    "difference",
+    "difference_all",
+    "limit",
+    "pipe",
+    "count",
+    "sum",
+    "total",
+    "first",
+    "last",
+    "nth",
+    "row_number",
+    "rank",
+    "dense_rank",
+    "lead",
+    "lag",
+    "mean",
+    "min",
+    "max",
+    "cov_samp",
+    "var_samp",
+    "stdev_samp",
+    "cov_pop",
+    "var_pop",
+    "stdev_pop",
+    "pretty",
+    "show",
+)
+
 
-@public  # type: ignore[misc]
 def const(x: T | None) -> Callable[[AbstractRow], T | None]:
     """Return a function that returns `x` regardless of input."""
     return lambda _: x
 
 
-@public  # type: ignore[misc]
 def get(name: str) -> Callable[[AbstractRow], T | None]:
     """Return a function that gets the `name` field from a row."""
     return operator.itemgetter(name)
 
 
-@private  # type: ignore[misc]
-class shiftable(toolz.curry):
-    """Shiftable curry."""
+@functools.lru_cache(maxsize=None)
+def _signature(func: Callable[..., Any]) -> inspect.Signature:
+    """Compute and cache the signature of `func`.
+
+    :func:`inspect.signature` is slow and the functions wrapped by
+    :class:`shiftable` are defined once at module scope, so there's no point
+    in recomputing their signatures every time they're introspected.
+
+    """
+    return inspect.signature(func)
+
+
+@functools.lru_cache(maxsize=None)
+def _required_parameters(func: Callable[..., Any]) -> tuple[str, ...]:
+    """Return the names of the parameters of `func` that have no default."""
+    return tuple(
+        name
+        for name, parameter in _signature(func).parameters.items()
+        if parameter.default is inspect.Parameter.empty
+        and parameter.kind
+        not in (inspect.Parameter.VAR_POSITIONAL, inspect.Parameter.VAR_KEYWORD)
+    )
+
+
+class shiftable:  # noqa: D101
+    # Shiftable curry.
+    #
+    # There's no class docstring because ``__doc__`` is a slot: each instance
+    # carries the docstring of the function it wraps so that its doctests are
+    # collected.
+    __slots__ = (
+        "func",
+        "args",
+        "keywords",
+        "required",
+        "__doc__",
+        "__name__",
+        "__qualname__",
+        "__wrapped__",
+    )
+
+    def __init__(self, func: Callable[..., Any], *args: Any, **keywords: Any) -> None:
+        self.func = func
+        self.args = args
+        self.keywords = keywords
+        self.required = _required_parameters(func)
+        self.__doc__ = func.__doc__
+        self.__name__ = func.__name__
+        self.__qualname__ = func.__qualname__
+        self.__wrapped__ = func
 
     @property
     def __signature__(self) -> inspect.Signature:
-        return inspect.signature(self.func)  # pragma: no cover
-
-    def __rrshift__(self, other: Relation) -> shiftable:
-        return self(other)
+        return _signature(self.func)
+
+    def __call__(self, *args: Any, **keywords: Any) -> Any:
+        """Call the wrapped function once every required argument is bound."""
+        func = self.func
+        args = self.args + args
+        keywords = {**self.keywords, **keywords} if keywords else self.keywords
+        required = self.required
+        if len(args) < len(required):
+            for name in required[len(args) :]:
+                if name not in keywords:
+                    return shiftable(func, *args, **keywords)
+        return func(*args, **keywords)
+
+    def __rrshift__(self, other: Relation) -> Any:
+        # the same as ``self(other)``, without the extra call
+        func = self.func
+        args = (*self.args, other)
+        keywords = self.keywords
+        required = self.required
+        if len(args) < len(required):
+            for name in required[len(args) :]:
+                if name not in keywords:
+                    return shiftable(func, *args, **keywords)
+        return func(*args, **keywords)
+
+    def __repr__(self) -> str:
+        return f"<shiftable {self.__qualname__}>"
 
 
-@public  # type: ignore[misc]
 @shiftable
-def table(rows: Iterable[Mapping[str, Any]]) -> Table:
+def table(
+    rows: Iterable[Mapping[str, Any]], *, columnar: bool | None = None
+) -> Relation:
     """Construct a relation from an iterable of mappings.
 
     Parameters
     ----------
     rows
         An iterable of mappings whose keys are :class:`str` instances.
+    columnar
+        Whether to store `rows` as columns, which makes aggregations over
+        columns selected with :func:`get` faster. If :data:`None`, store
+        `rows` as columns when it's a :class:`list` or :class:`tuple`, every
+        value of its first row is a scalar, such as a number, a string, a date
+        or :data:`None`, and every row has the same keys. Any other iterable
+        is consumed lazily, one row at a time.
 
     Examples
     --------
@@ -128,10 +268,46 @@ def table(rows: Iterable[Mapping[str, Any]]) -> Table:
     Alice         700
 
     """
-    return Table.from_iterable(rows)
+    if columnar is not None:
+        if columnar:
+            return ColumnarTable.from_mappings(list(rows))
+        return Table.from_iterable(rows)
+
+    if not isinstance(rows, (list, tuple)):
+        # an iterator might be unbounded, or too large to hold in memory, so
+        # its rows are only consumed as they're needed
+        return Table.from_iterable(rows)
+    if not rows:
+        return Table.from_iterable(())
+    first = rows[0]
+    if not first or any(type(value) not in _SCALAR_TYPES for value in first.values()):
+        return Table.from_iterable(rows)
+
+    try:
+        return ColumnarTable.from_mappings(rows)
+    except ValueError:
+        return Table.from_iterable(rows)
+
+
+# values that are stored as is in the columns of a columnar table, and that
+# make it likely every other row holds the same kind of values
+_SCALAR_TYPES = frozenset(
+    (
+        bool,
+        int,
+        float,
+        decimal.Decimal,
+        str,
+        bytes,
+        datetime.date,
+        datetime.datetime,
+        datetime.time,
+        datetime.timedelta,
+        type(None),
+    )
+)
 
 
-@public  # type: ignore[misc]
 @shiftable
 def cross_join(right: Relation, left: Relation) -> Join:
     """Return the Cartesian product of tuples from `left` and `right`.
@@ -178,7 +354,6 @@ def cross_join(right: Relation, left: Relation) -> Join:
     return CrossJoin(left, right)
 
 
-@public  # type: ignore[misc]
 @shiftable
 def inner_join(right: Relation, predicate: JoinPredicate, left: Relation) -> Join:
     """Join `left` and `right` relations using `predicate`.
@@ -220,7 +395,6 @@ def inner_join(right: Relation, predicate: JoinPredicate, left: Relation) -> Joi
     return InnerJoin(left, right, predicate)
 
 
-@public  # type: ignore[misc]
 @shiftable
 def left_join(right: Relation, predicate: JoinPredicate, left: Relation) -> LeftJoin:
     """Join `left` and `right` relations using `predicate`.
@@ -239,7 +413,6 @@ def left_join(right: Relation, predicate: JoinPredicate, left: Relation) -> Left
     return LeftJoin(left, right, predicate)
 
 
-@public  # type: ignore[misc]
 @shiftable
 def right_join(right: Relation, predicate: JoinPredicate, left: Relation) -> RightJoin:
     """Join `left` and `right` relations using `predicate`.
@@ -258,21 +431,13 @@ def right_join(right: Relation, predicate: JoinPredicate, left: Relation) -> Rig
     return RightJoin(left, right, predicate)
 
 
-@public  # type: ignore[misc]
 @shiftable
 def full_join(right: Relation, predicate: JoinPredicate, left: Relation) -> Relation:
     """Full outer join."""
     raise NotImplementedError("full outer joins are not yet supported")
 
 
-@private  # type: ignore[misc]
-@shiftable
-def _order_by(order_by: tuple[OrderBy, ...], nulls: Nulls, child: Relation) -> SortBy:
-    return SortBy(child, order_by, nulls)
-
-
-@public  # type: ignore[misc]
-def order_by(*order_by: OrderBy, nulls: Nulls = Nulls.FIRST) -> SortBy:
+def order_by(*order_by: OrderBy, nulls: Nulls = Nulls.FIRST) -> shiftable:
     """Order the rows of the child operator according to `order_by`.
 
     Parameters
@@ -301,19 +466,10 @@ def order_by(*order_by: OrderBy, nulls: Nulls = Nulls.FIRST) -> SortBy:
     [-300, -100, 400, 700]
 
     """
-    return _order_by(order_by, nulls)
-
-
-@private  # type: ignore[misc]
-@shiftable
-def _select(
-    projectors: Mapping[str, Projector | WindowAggregateSpecification], child: Relation
-) -> Projection:
-    return Projection(child, projectors)
+    return shiftable(SortBy, order_by=order_by, null_ordering=nulls)
 
 
-@public  # type: ignore[misc]
-def select(**projectors: Projector | WindowAggregateSpecification) -> Projection:
+def select(**projectors: Projector | WindowAggregateSpecification) -> shiftable:
     """Subset or compute new columns from `projectors`.
 
     Parameters
@@ -340,26 +496,15 @@ def select(**projectors: Projector | WindowAggregateSpecification) -> Projection
     mutate
 
     """
-    valid_projectors = {
-        name: projector
-        for name, projector in projectors.items()
-        if callable(projector) or isinstance(projector, WindowAggregateSpecification)
-    }
-    if len(valid_projectors) != len(projectors):
-        raise TypeError("Invalid projection")
-    return _select(projectors)
-
-
-@private  # type: ignore[misc]
-@shiftable
-def _mutate(
-    mutators: Mapping[str, Projector | WindowAggregateSpecification], child: Relation
-) -> Mutate:
-    return Mutate(child, mutators)
+    for name, projector in projectors.items():
+        if not (
+            callable(projector) or isinstance(projector, WindowAggregateSpecification)
+        ):
+            raise TypeError(f"Invalid projection: {name!r}")
+    return shiftable(Projection.fused, projections=projectors)
 
 
-@public  # type: ignore[misc]
-def mutate(**mutators: Projector | WindowAggregateSpecification) -> Mutate:
+def mutate(**mutators: Projector | WindowAggregateSpecification) -> shiftable:
     """Add new columns specified by `mutators`.
 
     Parameters
@@ -394,12 +539,11 @@ def mutate(**mutators: Projector | WindowAggregateSpecification) -> Mutate:
     select
 
     """
-    return _mutate(mutators)
+    return shiftable(Mutate.fused, projections=mutators)
 
 
-@public  # type: ignore[misc]
 @shiftable
-def sift(predicate: Predicate, child: Relation) -> Selection:
+def sift(predicate: Predicate, child: Relation) -> Relation:
     """Filter rows in `child` according to `predicate`.
 
     Parameters
@@ -425,29 +569,69 @@ def sift(predicate: Predicate, child: Relation) -> Selection:
     Alice         700
 
     """
-    return Selection(child, predicate)
+    return Selection.pushed(child, predicate)
+
+
+def sift_all(*predicates: Predicate) -> shiftable:
+    """Filter rows in the child operator for which every one of `predicates` is true.
+
+    Parameters
+    ----------
+    predicates
+        Callables of one argument taking an :class:`~stupidb.row.AbstractRow`
+        and returning a ``bool``.
+
+    Notes
+    -----
+    Unlike a single predicate that combines conditions with ``and``,
+    `predicates` aren't checked in the order they're given. Predicates that
+    only test columns for equality are checked first, then other comparisons
+    of columns, then everything else, stopping at the first one that's false.
+    Predicates therefore must not rely on another predicate having been
+    checked first, for example to rule out ``NULL`` values.
+
+    Examples
+    --------
+    >>> from stupidb import sift_all, table
+    >>> rows = [
+    ...     dict(name="Bob", balance=-300),
+    ...     dict(name="Alice", balance=400),
+    ...     dict(name="Bob", balance=-100),
+    ...     dict(name="Alice", balance=700),
+    ... ]
+    >>> rows = table(rows) >> sift_all(
+    ...     lambda r: r.name.lower().startswith("a"),
+    ...     lambda r: r.balance > 500,
+    ... )
+    >>> rows
+    name      balance
+    ------  ---------
+    Alice         700
+
+    """
+    if not predicates:
+        raise TypeError("sift_all requires at least one predicate")
+    return sift(conjunction(sorted(predicates, key=estimated_cost)))
 
 
-@public  # type: ignore[misc]
 def exists(relation: Relation) -> bool:
     """Compute whether any of the rows in `relation` are truthy.
 
     This is useful for computing semi-joins.
 
     """
+    if isinstance(relation, ColumnarTable):
+        # don't build a row just to see that there is one, the columns of a
+        # stored table are already there
+        return bool(next(iter(relation.columns.values()), ()))
+    if isinstance(relation, Relation):
+        # relations never produce empty rows, so there's no need to check the
+        # truthiness of the first row
+        return next(iter(relation), None) is not None
     return any(relation)
 
 
-@private  # type: ignore[misc]
-@shiftable
-def _aggregate(
-    aggregations: Mapping[str, AggregateSpecification], child: Relation
-) -> Aggregation:
-    return Aggregation(child, aggregations)
-
-
-@public  # type: ignore[misc]
-def aggregate(**aggregations: AggregateSpecification) -> Aggregation:
+def aggregate(**aggregations: AggregateSpecification) -> shiftable:
     """Aggregate values from the child operator using `aggregations`.
 
     Parameters
@@ -490,10 +674,9 @@ def aggregate(**aggregations: AggregateSpecification) -> Aggregation:
     group_by
 
     """
-    return _aggregate(aggregations)
+    return shiftable(Aggregation, metrics=aggregations)
 
 
-@public  # type: ignore[misc]
 @shiftable
 def over(
     window: FrameClause, child: AggregateSpecification
@@ -553,14 +736,7 @@ def over(
     return WindowAggregateSpecification(child.aggregate_type, child.getters, window)
 
 
-@private  # type: ignore[misc]
-@shiftable
-def _group_by(group_by: Mapping[str, PartitionBy], child: Relation) -> GroupBy:
-    return GroupBy(child, group_by)
-
-
-@public  # type: ignore[misc]
-def group_by(**group_by: PartitionBy) -> GroupBy:
+def group_by(**group_by: PartitionBy) -> shiftable:
     """Group the rows of the child operator according to `group_by`.
 
     Parameters
@@ -600,12 +776,11 @@ def group_by(**group_by: PartitionBy) -> GroupBy:
     aggregate
 
     """
-    return _group_by(group_by)
+    return shiftable(GroupBy, group_by=group_by)
 
 
-@public  # type: ignore[misc]
 @shiftable
-def union(right: Relation, left: Relation) -> Union:
+def union(right: Relation, left: Relation) -> Relation:
     """Compute the union of `left` and `right`, ignoring duplicate rows.
 
     Parameters
@@ -620,10 +795,9 @@ def union(right: Relation, left: Relation) -> Union:
     union_all
 
     """
-    return Union(left, right)
+    return Union.folded(left, right)
 
 
-@public  # type: ignore[misc]
 @shiftable
 def union_all(right: Relation, left: Relation) -> UnionAll:
     """Compute the union of `left` and `right`, preserving duplicate rows.
@@ -643,9 +817,8 @@ def union_all(right: Relation, left: Relation) -> UnionAll:
     return UnionAll(left, right)
 
 
-@public  # type: ignore[misc]
 @shiftable
-def intersect(right: Relation, left: Relation) -> Intersect:
+def intersect(right: Relation, left: Relation) -> Relation:
     """Compute the intersection of `left` and `right`, ignoring duplicate rows.
 
     Parameters
@@ -660,10 +833,9 @@ def intersect(right: Relation, left: Relation) -> Intersect:
     intersect_all
 
     """
-    return Intersect(left, right)
+    return Intersect.folded(left, right)
 
 
-@public  # type: ignore[misc]
 @shiftable
 def intersect_all(right: Relation, left: Relation) -> IntersectAll:
     """Compute the intersection of `left` and `right`, preserving duplicates.
@@ -683,9 +855,8 @@ def intersect_all(right: Relation, left: Relation) -> IntersectAll:
     return IntersectAll(left, right)
 
 
-@public  # type: ignore[misc]
 @shiftable
-def difference(right: Relation, left: Relation) -> Difference:
+def difference(right: Relation, left: Relation) -> Relation:
     """Compute the set difference of `left` and `right`.
 
     Parameters
@@ -696,12 +867,11 @@ def difference(right: Relation, left: Relation) -> Difference:
          A relation
 
     """
-    return Difference(left, right)
+    return Difference.folded(left, right)
 
 
-@public  # type: ignore[misc]
 @shiftable
-def difference_all(right: Relation, left: Relation) -> DifferenceAll:
+def difference_all(right: Relation, left: Relation) -> Relation:
     """Compute the set difference of `left` and `right`, preserving duplicates.
 
     Parameters
@@ -712,12 +882,11 @@ def difference_all(right: Relation, left: Relation) -> DifferenceAll:
          A relation
 
     """
-    return DifferenceAll(left, right)
+    return DifferenceAll.folded(left, right)
 
 
-@public  # type: ignore[misc]
 @shiftable
-def limit(limit: int | None, relation: Relation, *, offset: int = 0) -> Limit:
+def limit(limit: int | None, relation: Relation, *, offset: int = 0) -> Relation:
     """Return the rows in `relation` starting from `offset` up to `limit`.
 
     Parameters
@@ -729,15 +898,61 @@ def limit(limit: int | None, relation: Relation, *, offset: int = 0) -> Limit:
     offset
         The number of rows to skip before yielding
 
+    Notes
+    -----
+    `relation` is returned as is if there's no limit and no offset.
+
     """
     if offset < 0:
         raise ValueError(f"invalid offset, must be non-negative: {offset}")
-    if limit is not None and limit < 0:
+    if limit is None:
+        if not offset:
+            return relation
+    elif limit < 0:
         raise ValueError(f"invalid limit, must be non-negative or None: {limit}")
     return Limit(relation, offset=offset, limit=limit)
 
 
-@public  # type: ignore[misc]
+def pipe(relation: Relation, *operations: Callable[[Relation], Any]) -> Any:
+    """Apply each of `operations` in turn, starting with `relation`.
+
+    ``pipe(relation, f, g)`` is equivalent to ``relation >> f >> g``, without
+    going through :meth:`shiftable.__rrshift__` for every operation. This is
+    useful for building pipelines programmatically.
+
+    Parameters
+    ----------
+    relation
+        The relation to start from.
+    operations
+        Callables of one argument, such as the result of calling
+        :func:`select` or :func:`sift` without a child relation.
+
+    Examples
+    --------
+    >>> from stupidb import order_by, pipe, sift, table
+    >>> rows = [
+    ...     dict(name="Bob", balance=-300),
+    ...     dict(name="Alice", balance=400),
+    ...     dict(name="Bob", balance=-100),
+    ...     dict(name="Alice", balance=700),
+    ... ]
+    >>> pipe(
+    ...     table(rows),
+    ...     sift(lambda r: r.balance > 0),
+    ...     order_by(lambda r: r.balance),
+    ... )
+    name      balance
+    ------  ---------
+    Alice         400
+    Alice         700
+
+    """
+    for operation in operations:
+        relation = operation(relation)
+    return relation
+
+
 def count(x: Callable[[AbstractRow], T | None]) -> AggregateSpecification:
     """Count the number of non-NULL values of `x`.
 
@@ -750,7 +965,6 @@ def count(x: Callable[[AbstractRow], T | None]) -> AggregateSpecification:
     return AggregateSpecification(Count, x)
 
 
-@public  # type: ignore[misc]
 def sum(x: Callable[[AbstractRow], R | None]) -> AggregateSpecification:
     """Compute the sum of `x`, with an empty column summing to NULL.
 
@@ -763,7 +977,6 @@ def sum(x: Callable[[AbstractRow], R | None]) -> AggregateSpecification:
     return AggregateSpecification(Sum, x)
 
 
-@public  # type: ignore[misc]
 def total(x: Callable[[AbstractRow], R | None]) -> AggregateSpecification:
     """Compute the sum of `x`, with an empty column summing to zero.
 
@@ -776,7 +989,6 @@ def total(x: Callable[[AbstractRow], R | None]) -> AggregateSpecification:
     return AggregateSpecification(Total, x)
 
 
-@public  # type: ignore[misc]
 def first(x: Callable[[AbstractRow], T | None]) -> AggregateSpecification:
     """Compute the first row of `x` over a window.
 
@@ -789,7 +1001,6 @@ def first(x: Callable[[AbstractRow], T | None]) -> AggregateSpecification:
     return AggregateSpecification(First, x)
 
 
-@public  # type: ignore[misc]
 def last(x: Callable[[AbstractRow], T | None]) -> AggregateSpecification:
     """Compute the last row of `x` over a window.
 
@@ -802,7 +1013,6 @@ def last(x: Callable[[AbstractRow], T | None]) -> AggregateSpecification:
     return AggregateSpecification(Last, x)
 
 
-@public  # type: ignore[misc]
 def nth(
     x: Callable[[AbstractRow], T | None],
     i: Callable[[AbstractRow], int | None],
@@ -820,29 +1030,25 @@ def nth(
     return AggregateSpecification(Nth, x, i)
 
 
-@public  # type: ignore[misc]
 def row_number() -> AggregateSpecification:
     """Compute the row number over a window."""
     return AggregateSpecification(RowNumber)
 
 
-@public  # type: ignore[misc]
 def rank() -> AggregateSpecification:
     """Rank the rows of a relation based on the ordering key given in `over`."""
     return AggregateSpecification(Rank)
 
 
-@public  # type: ignore[misc]
 def dense_rank() -> AggregateSpecification:
     """Rank the rows of a relation based on the ordering key given in `over`."""
     return AggregateSpecification(DenseRank)
 
 
-@public  # type: ignore[misc]
 def lead(
     x: Callable[[AbstractRow], T | None],
-    n: Callable[[AbstractRow], int | None] = const(1),
-    default: Callable[[AbstractRow], T | None] = const(None),
+    n: Callable[[AbstractRow], int | None] = default_offset,
+    default: Callable[[AbstractRow], T | None] = default_value,
 ) -> AggregateSpecification:
     """Lead a column `x` by `n` rows, using `default` for NULL values.
 
@@ -863,11 +1069,10 @@ def lead(
     return AggregateSpecification(Lead, x, n, default)
 
 
-@public  # type: ignore[misc]
 def lag(
     x: Callable[[AbstractRow], T | None],
-    n: Callable[[AbstractRow], int | None] = const(1),
-    default: Callable[[AbstractRow], T | None] = const(None),
+    n: Callable[[AbstractRow], int | None] = default_offset,
+    default: Callable[[AbstractRow], T | None] = default_value,
 ) -> AggregateSpecification:
     """Lag a column `x` by `n` rows, using `default` for NULL values.
 
@@ -888,7 +1093,6 @@ def lag(
     return AggregateSpecification(Lag, x, n, default)
 
 
-@public  # type: ignore[misc]
 def mean(x: Callable[[AbstractRow], R | None]) -> AggregateSpecification:
     """Compute the average of a column.
 
@@ -901,7 +1105,6 @@ def mean(x: Callable[[AbstractRow], R | None]) -> AggregateSpecification:
     return AggregateSpecification(Mean, x)
 
 
-@public  # type: ignore[misc]
 def min(x: Callable[[AbstractRow], Comparable | None]) -> AggregateSpecification:
     """Compute the minimum of a column.
 
@@ -914,7 +1117,6 @@ def min(x: Callable[[AbstractRow], Comparable | None]) -> AggregateSpecification
     return AggregateSpecification(Min, x)
 
 
-@public  # type: ignore[misc]
 def max(x: Callable[[AbstractRow], Comparable | None]) -> AggregateSpecification:
     """Compute the maximum of a column.
 
@@ -927,7 +1129,6 @@ def max(x: Callable[[AbstractRow], Comparable | None]) -> AggregateSpecification
     return AggregateSpecification(Max, x)
 
 
-@public  # type: ignore[misc]
 def cov_samp(
     x: Callable[[AbstractRow], R1 | None], y: Callable[[AbstractRow], R2 | None]
 ) -> AggregateSpecification:
@@ -944,7 +1145,6 @@ def cov_samp(
     return AggregateSpecification(SampleCovariance, x, y)
 
 
-@public  # type: ignore[misc]
 def var_samp(x: Callable[[AbstractRow], R | None]) -> AggregateSpecification:
     """Compute the sample variance of a column.
 
@@ -957,7 +1157,6 @@ def var_samp(x: Callable[[AbstractRow], R | None]) -> AggregateSpecification:
     return AggregateSpecification(SampleVariance, x)
 
 
-@public  # type: ignore[misc]
 def stdev_samp(x: Callable[[AbstractRow], R | None]) -> AggregateSpecification:
     """Compute the sample standard deviation of a column.
 
@@ -970,7 +1169,6 @@ def stdev_samp(x: Callable[[AbstractRow], R | None]) -> AggregateSpecification:
     return AggregateSpecification(SampleStandardDeviation, x)
 
 
-@public  # type: ignore[misc]
 def cov_pop(
     x: Callable[[AbstractRow], R1 | None], y: Callable[[AbstractRow], R2 | None]
 ) -> AggregateSpecification:
@@ -987,7 +1185,6 @@ def cov_pop(
     return AggregateSpecification(PopulationCovariance, x, y)
 
 
-@public  # type: ignore[misc]
 def var_pop(x: Callable[[AbstractRow], R]) -> AggregateSpecification:
     """Compute the population variance of a column.
 
@@ -1000,7 +1197,6 @@ def var_pop(x: Callable[[AbstractRow], R]) -> AggregateSpecification:
     return AggregateSpecification(PopulationVariance, x)
 
 
-@public  # type: ignore[misc]
 def stdev_pop(x: Callable[[AbstractRow], R | None]) -> AggregateSpecification:
     """Compute the population standard deviation of a column.
 
@@ -1013,7 +1209,129 @@ def stdev_pop(x: Callable[[AbstractRow], R | None]) -> AggregateSpecification:
     return AggregateSpecification(PopulationStandardDeviation, x)
 
 
-@public  # type: ignore[misc]
+def _columnize(rows: Iterable[AbstractRow]) -> dict[str, list[Any]]:
+    """Transpose `rows` into columns in a single pass.
+
+    Columns are ordered by first appearance and rows missing a column are
+    filled with :data:`None`, matching what :func:`tabulate.tabulate` does
+    with ``headers="keys"``.
+
+    """
+    columns: dict[str, list[Any]] = {}
+    nrows = 0
+    for row in rows:
+        for name, value in row.items():
+            try:
+                column = columns[name]
+            except KeyError:
+                column = columns[name] = [None] * nrows
+            column.append(value)
+        nrows += 1
+        for column in columns.values():
+            if len(column) < nrows:
+                column.append(None)
+    return columns
+
+
+def _is_plain_text(text: str) -> bool:
+    """Return whether `text` is printable ASCII that doesn't look like a number.
+
+    Anything else is subject to tabulate's number parsing, wide character and
+    multiline handling, which we leave to tabulate.
+
+    """
+    if not text.isascii() or not text.isprintable():
+        return False
+    try:
+        float(text.replace(",", ""))
+    except ValueError:
+        return True
+    return False
+
+
+def _afterpoint(text: str) -> int:
+    """Return the number of characters after the decimal point of `text`."""
+    position = text.rfind(".")
+    if position < 0:
+        position = text.rfind("e")
+    return len(text) - position - 1 if position >= 0 else -1
+
+
+def _format_column(name: str, values: list[Any]) -> list[str] | None:
+    """Format and align `values` the way tabulate's ``"simple"`` format does.
+
+    The first element of the result is the aligned header. Returns
+    :data:`None` if `values` contains anything we don't handle identically to
+    tabulate.
+
+    """
+    has_values = has_floats = False
+    numeric = True
+    for value in values:
+        if value is None or value == "":
+            continue
+        has_values = True
+        kind = type(value)
+        if kind is int:
+            continue
+        if kind is float:
+            if not math.isfinite(value):
+                return None
+            has_floats = True
+            continue
+        numeric = False
+        if kind is not str and not hasattr(value, "isoformat"):
+            return None
+        if not _is_plain_text(str(value)):
+            return None
+
+    numeric = numeric and has_values
+    if not numeric:
+        cells = ["" if value is None else f"{value}".strip() for value in values]
+    elif has_floats:
+        cells = [
+            "" if value is None or value == "" else format(float(value), "g")
+            for value in values
+        ]
+    else:
+        cells = ["" if value is None else f"{value}" for value in values]
+
+    if numeric:
+        # decimal alignment: pad each number so the decimal points line up
+        decimals = [_afterpoint(cell) if cell else -1 for cell in cells]
+        maxdecimals = builtins.max(decimals)
+        cells = [
+            cell + " " * (maxdecimals - ndecimals)
+            for cell, ndecimals in zip(cells, decimals)
+        ]
+
+    width = builtins.max(len(name) + 2, builtins.max(map(len, cells), default=0))
+    if numeric:
+        return [name.rjust(width), *(cell.rjust(width) for cell in cells)]
+    return [name.ljust(width), *(cell.ljust(width) for cell in cells)]
+
+
+def _format_simple(columns: Mapping[str, list[Any]]) -> str | None:
+    """Render `columns` in tabulate's ``"simple"`` table format.
+
+    Returns :data:`None` if tabulate should be used to format `columns`.
+
+    """
+    if not columns:
+        return None
+    formatted_columns = []
+    for name, values in columns.items():
+        if not _is_plain_text(name):
+            return None
+        formatted = _format_column(name, values)
+        if formatted is None:
+            return None
+        formatted_columns.append(formatted)
+    header, *rows = zip(*formatted_columns)
+    separator = tuple("-" * len(cell) for cell in header)
+    return "\n".join("  ".join(line).rstrip() for line in (header, separator, *rows))
+
+
 @shiftable
 def pretty(
     rows: Relation,
@@ -1050,12 +1368,19 @@ def pretty(
     stupidb.api.show
 
     """
-    return tabulate.tabulate(
-        limit(n, rows), tablefmt=tablefmt, headers=headers, **kwargs
-    )
+    limited = limit(n, rows)
+    if tablefmt == "simple" and headers == "keys" and not kwargs:
+        columns = _columnize(limited)
+        formatted = _format_simple(columns)
+        if formatted is not None:
+            return formatted
+        # fall back to tabulate, reusing the rows we've already consumed
+        return tabulate.tabulate(
+            zip(*columns.values()), tablefmt=tablefmt, headers=list(columns)
+        )
+    return tabulate.tabulate(limited, tablefmt=tablefmt, headers=headers, **kwargs)
 
 
-@public  # type: ignore[misc]
 @shiftable
 def show(rows: Relation, **kwargs: Any) -> None:
     """Pretty-print a relation.
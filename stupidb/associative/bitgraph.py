@@ -4,8 +4,6 @@ from __future__ import annotations
 
 from typing import AbstractSet, Any, Iterable, Iterator, Mapping, MutableMapping
 
-import toolz
-
 from .bitset import BitSet
 
 
@@ -15,7 +13,9 @@ class BitGraph:
     __slots__ = "_nodes", "_predecessors"
 
     def __init__(self, nodes: Mapping[int, Iterable[int]]) -> None:
-        self._nodes: Mapping[int, AbstractSet[int]] = toolz.valmap(BitSet, nodes)
+        self._nodes: Mapping[int, AbstractSet[int]] = {
+            node: BitSet(children) for node, children in nodes.items()
+        }
         self._predecessors: MutableMapping[int, int] = {}
 
         for parent, children in self._nodes.items():
@@ -1,6 +1,5 @@
 from __future__ import annotations
 
-import collections
 import math
 from typing import Generic, Iterator, MutableSequence, Sequence
 
@@ -8,7 +7,6 @@ from ..aggregator import Aggregator
 from ..functions.associative.core import AssociativeAggregate
 from ..typehints import Result, T
 from . import indextree
-from .bitset import BitSet
 
 
 def make_segment_tree(
@@ -19,8 +17,8 @@ def make_segment_tree(
 ) -> Sequence[AssociativeAggregate]:
     """Make a segment tree from tuples `leaves` and class `aggregate_type`.
 
-    The algorithm used here traverses from the bottom of tree upward, updating
-    the parent every time a new node is seen.
+    The algorithm used here traverses from the bottom of tree upward one level
+    at a time, combining every populated node into its parent.
 
     Parameters
     ----------
@@ -31,34 +29,30 @@ def make_segment_tree(
 
     """
     number_of_leaves = len(leaf_arguments)
-    index_tree = indextree.IndexTree(
-        height=int(math.ceil(math.log(number_of_leaves, fanout))) + 1,
-        fanout=fanout,
-    )
+    height = int(math.ceil(math.log(number_of_leaves, fanout))) + 1
+    index_tree = indextree.IndexTree(height=height, fanout=fanout)
     num_nodes = len(index_tree)
     segment_tree_nodes: MutableSequence[AssociativeAggregate] = [
         aggregate_type() for _ in range(num_nodes)
     ]
-    queue = collections.deque(index_tree.leaves)
 
     # seed the leaves
-    for leaf_index, args in zip(queue, leaf_arguments):
-        segment_tree_nodes[leaf_index].step(*args)
-
-    seen = BitSet()
-
-    while queue:
-        node = queue.popleft()
-        if node not in seen:
-            seen.add(node)
-            node_agg = segment_tree_nodes[node]
-            parent = index_tree.parent(node)
-            parent_agg = segment_tree_nodes[parent]
-            parent_agg.combine(node_agg)
-            if parent:
-                # don't append the root, since we've already aggregated into
-                # that node if parent == 0
-                queue.append(parent)
+    first_leaf = index_tree.first_node(height - 1)
+    for node_agg, args in zip(segment_tree_nodes[first_leaf:], leaf_arguments):
+        node_agg.step(*args)
+
+    # Combine each level into the one above it, bottom up. Only the nodes
+    # covering at least one leaf hold any state, so the rest of each level is
+    # left alone. The parent of the node at `offset` in a level is the node at
+    # `offset // fanout` in the level above it.
+    populated = number_of_leaves
+    for level in reversed(range(1, height)):
+        first = index_tree.first_node(level)
+        parent_first = index_tree.first_node(level - 1)
+        for offset in range(populated):
+            parent_agg = segment_tree_nodes[parent_first + offset // fanout]
+            parent_agg.combine(segment_tree_nodes[first + offset])
+        populated = -(-populated // fanout)
     return segment_tree_nodes
 
 
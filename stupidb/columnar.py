@@ -0,0 +1,747 @@
+"""Column-at-a-time evaluation of row predicates and expressions.
+
+Predicates passed to :func:`~stupidb.api.sift` are arbitrary callables that
+take a row. When the relation being filtered stores its data by column, running
+the predicate once per row means building a row for every element of every
+column.
+
+This module recognizes a small family of predicates written as lambdas, such
+as ``lambda r: r.balance > 0 and r["name"] != "Bob"``, by inspecting their
+source. It compiles them into functions that compute the positions of the
+selected rows directly from the columns. Projections written as arithmetic on
+columns, such as ``lambda r: r.price * r.quantity``, are compiled into
+functions that compute a whole column the same way. Anything else is left to
+the row-at-a-time implementation.
+
+"""
+
+from __future__ import annotations
+
+import ast
+import collections
+import functools
+import heapq
+import inspect
+import itertools
+import linecache
+import operator
+import typing
+import weakref
+from typing import Any, Callable, Iterable, Iterator, Mapping, Sequence, Tuple
+
+from .row import AbstractRow, JoinedRow, Row
+
+Columns = Mapping[str, Sequence[Any]]
+Indices = Sequence[int]
+ColumnExpression = Callable[[Columns], Iterable[Any]]
+ColumnPredicate = Callable[[Columns, Indices], Indices]
+
+_COMPARISONS: Mapping[type[ast.cmpop], Callable[[Any, Any], Any]] = {
+    ast.Eq: operator.eq,
+    ast.NotEq: operator.ne,
+    ast.Lt: operator.lt,
+    ast.LtE: operator.le,
+    ast.Gt: operator.gt,
+    ast.GtE: operator.ge,
+    ast.Is: operator.is_,
+    ast.IsNot: operator.is_not,
+}
+
+_BINARY_OPERATORS: Mapping[type[ast.operator], Callable[[Any, Any], Any]] = {
+    ast.Add: operator.add,
+    ast.Sub: operator.sub,
+    ast.Mult: operator.mul,
+    ast.Div: operator.truediv,
+    ast.FloorDiv: operator.floordiv,
+    ast.Mod: operator.mod,
+    ast.Pow: operator.pow,
+}
+
+_UNARY_OPERATORS: Mapping[type[ast.unaryop], Callable[[Any], Any]] = {
+    ast.USub: operator.neg,
+    ast.UAdd: operator.pos,
+    ast.Not: operator.not_,
+    ast.Invert: operator.invert,
+}
+
+
+def take(column: Sequence[Any], indices: Indices) -> Sequence[Any]:
+    """Return the elements of `column` at `indices`."""
+    if isinstance(indices, range) and indices == range(len(column)):
+        return column
+    return list(map(column.__getitem__, indices))
+
+
+class TakenColumns(Mapping[str, Sequence[Any]]):
+    """The rows of `columns` at `indices`, taken one column at a time.
+
+    Columns are only copied when they're looked up, so a selection followed by
+    an aggregation of one column copies that column and nothing else.
+
+    """
+
+    __slots__ = "columns", "indices", "taken"
+
+    def __init__(self, columns: Columns, indices: Indices) -> None:
+        self.columns = columns
+        self.indices = indices
+        self.taken: dict[str, Sequence[Any]] = {}
+
+    def __getitem__(self, name: str) -> Sequence[Any]:
+        taken = self.taken
+        try:
+            return taken[name]
+        except KeyError:
+            column = taken[name] = take(self.columns[name], self.indices)
+            return column
+
+    def __iter__(self) -> Iterator[str]:
+        return iter(self.columns)
+
+    def __len__(self) -> int:
+        return len(self.columns)
+
+
+def getter_column(getter: Callable[..., Any]) -> str | None:
+    """Return the column that `getter` looks up, if it's known.
+
+    Getters constructed with :func:`~stupidb.api.get` and lambdas that do
+    nothing but look up a column, such as ``lambda r: r.a`` or
+    ``lambda r: r["a"]``, are recognized. Any other callable returns
+    :data:`None`.
+
+    """
+    if isinstance(getter, operator.itemgetter):
+        _, keys = typing.cast(Tuple[Any, Tuple[Any, ...]], getter.__reduce__())
+        if len(keys) != 1:
+            return None
+        (column,) = keys
+        return column if isinstance(column, str) else None
+    try:
+        return _getter_columns[getter]
+    except (KeyError, TypeError):
+        pass
+    node = _single_argument_lambda(getter)
+    column = (
+        None if node is None else _Compiler(node.args.args[0].arg).column(node.body)
+    )
+    try:
+        _getter_columns[getter] = column
+    except TypeError:
+        # not every callable can be weakly referenced
+        pass
+    return column
+
+
+_getter_columns: weakref.WeakKeyDictionary[
+    Callable[..., Any], str | None
+] = weakref.WeakKeyDictionary()
+
+
+def sort_indices(
+    columns: Columns, names: Sequence[str], *, nulls_first: bool
+) -> list[int]:
+    """Return the positions of the rows of `columns` sorted by `names`.
+
+    Rows are compared the same way as by :func:`argsort`.
+
+    """
+    nrows = len(next(iter(columns.values()), ()))
+    keys = [columns[name] for name in names]
+    if not keys:
+        return list(range(nrows))
+    if len(keys) == 1 and None not in keys[0]:
+        return sorted(range(nrows), key=keys[0].__getitem__)
+    return argsort(list(zip(*keys)), nulls_first=nulls_first)
+
+
+def argsort(keys: Sequence[tuple[Any, ...]], *, nulls_first: bool) -> list[int]:
+    """Return the positions of `keys` in sorted order.
+
+    Keys are compared the same way as
+    :func:`~stupidb.aggregation.row_key_compare` compares rows. Keys whose
+    values are both NULL compare equal, regardless of any later value. The sort
+    is stable.
+
+    """
+    if any(None in key for key in keys):
+        null_flag, value_flag = (0, 1) if nulls_first else (1, 0)
+        keys = [_null_aware_key(key, null_flag, value_flag) for key in keys]
+    return sorted(range(len(keys)), key=keys.__getitem__)
+
+
+def _null_aware_key(
+    values: Sequence[Any], null_flag: int, value_flag: int
+) -> tuple[tuple[Any, ...], ...]:
+    key: list[tuple[Any, ...]] = []
+    for value in values:
+        if value is None:
+            key.append((null_flag,))
+            break
+        key.append((value_flag, value))
+    return tuple(key)
+
+
+def transpose(names: Sequence[str], rows: Iterable[Sequence[Any]]) -> Columns:
+    """Convert `rows` of values into columns called `names`."""
+    columns = list(zip(*rows))
+    if not columns:
+        return {name: () for name in names}
+    return dict(zip(names, columns))
+
+
+def getter_columns(getters: Iterable[Callable[..., Any]]) -> list[str] | None:
+    """Return the columns that `getters` look up, if they're all known."""
+    names = list(map(getter_column, getters))
+    return None if None in names else typing.cast(typing.List[str], names)
+
+
+def columns_getter(
+    names: Sequence[str],
+) -> Callable[[Mapping[str, Any]], tuple[Any, ...]]:
+    """Return a function that looks up the values of `names` in a row."""
+    if not names:
+        return lambda row: ()
+    if len(names) == 1:
+        (name,) = names
+        return lambda row: (row[name],)
+    return operator.itemgetter(*names)
+
+
+def iterrows(columns: Columns) -> Iterator[AbstractRow]:
+    """Iterate over the rows of `columns`."""
+    names = tuple(columns)
+    return (
+        Row(dict(zip(names, values)), _id=id)
+        for id, values in enumerate(zip(*columns.values()))
+    )
+
+
+@functools.lru_cache(maxsize=32)
+def _lambdas(source: str) -> Mapping[int, Sequence[ast.Lambda]]:
+    """Return the lambdas in `source`, keyed by the line they start on."""
+    try:
+        tree = ast.parse(source)
+    except SyntaxError:
+        return {}
+    lambdas: dict[int, list[ast.Lambda]] = collections.defaultdict(list)
+    for node in ast.walk(tree):
+        if isinstance(node, ast.Lambda):
+            lambdas[node.lineno].append(node)
+    return lambdas
+
+
+def _lambda_node(func: Callable[..., Any]) -> ast.Lambda | None:
+    """Find the syntax tree of the lambda `func`, if its source is available."""
+    code = getattr(func, "__code__", None)
+    if code is None or code.co_name != "<lambda>" or code.co_freevars:
+        return None
+
+    filename = code.co_filename
+    candidates = _lambdas("".join(linecache.getlines(filename))).get(
+        code.co_firstlineno, ()
+    )
+
+    # There can be more than one lambda on a line, and the source may have
+    # changed since `func` was defined, so compare the bytecode of each
+    # candidate with the bytecode of `func`.
+    matches = []
+    for node in candidates:
+        expression = ast.fix_missing_locations(ast.Expression(body=node))
+        (candidate,) = (
+            const
+            for const in compile(expression, filename, "eval").co_consts
+            if inspect.iscode(const)
+        )
+        if (
+            candidate.co_code == code.co_code
+            and candidate.co_consts == code.co_consts
+            and candidate.co_names == code.co_names
+        ):
+            matches.append(node)
+    return matches[0] if len(matches) == 1 else None
+
+
+def _positional_lambda(func: Callable[..., Any], nargs: int) -> ast.Lambda | None:
+    """Find the syntax tree of `func` if it's a lambda of `nargs` arguments."""
+    node = _lambda_node(func)
+    if node is None:
+        return None
+    args = node.args
+    if (
+        args.posonlyargs
+        or args.vararg
+        or args.kwonlyargs
+        or args.kwarg
+        or args.defaults
+        or len(args.args) != nargs
+    ):
+        return None
+    return node
+
+
+def _single_argument_lambda(func: Callable[..., Any]) -> ast.Lambda | None:
+    """Find the syntax tree of `func` if it's a lambda of a single argument."""
+    return _positional_lambda(func, 1)
+
+
+class _Compiler:
+    """Translate the body of a single argument lambda into a column predicate."""
+
+    __slots__ = ("arg",)
+
+    def __init__(self, arg: str) -> None:
+        self.arg = arg
+
+    def column(self, node: ast.expr) -> str | None:
+        """Return the column referenced by `node`, if any."""
+        if not isinstance(node, (ast.Subscript, ast.Attribute)):
+            return None
+        value = node.value
+        if not isinstance(value, ast.Name) or value.id != self.arg:
+            return None
+        if isinstance(node, ast.Attribute):
+            # attribute access only falls through to the row's data when the
+            # row itself has no attribute of that name
+            if hasattr(Row, node.attr) or hasattr(JoinedRow, node.attr):
+                return None
+            return node.attr
+        key = node.slice
+        if isinstance(key, ast.Constant) and isinstance(key.value, str):
+            return key.value
+        return None
+
+    def operand(self, node: ast.expr) -> tuple[str | None, Any] | None:
+        """Return the column name or literal value of `node`."""
+        column = self.column(node)
+        if column is not None:
+            return column, None
+        try:
+            return None, ast.literal_eval(node)
+        except ValueError:
+            return None
+
+    def compile(self, node: ast.expr) -> ColumnPredicate | None:
+        if isinstance(node, ast.BoolOp):
+            operands = [self.compile(value) for value in node.values]
+            if any(operand is None for operand in operands):
+                return None
+            combine = _conjunction if isinstance(node.op, ast.And) else _disjunction
+            return functools.reduce(combine, operands)  # type: ignore[arg-type]
+        if isinstance(node, ast.UnaryOp) and isinstance(node.op, ast.Not):
+            operand = self.compile(node.operand)
+            return None if operand is None else functools.partial(_negate, operand)
+        if isinstance(node, ast.Compare):
+            comparisons = []
+            left = node.left
+            for op, right in zip(node.ops, node.comparators):
+                comparison = self.comparison(left, op, right)
+                if comparison is None:
+                    return self.computed(node)
+                comparisons.append(comparison)
+                left = right
+            return functools.reduce(_conjunction, comparisons)
+        column = self.column(node)
+        if column is not None:
+            return functools.partial(_compare, bool, ((column, None),))
+        return self.computed(node)
+
+    def computed(self, node: ast.expr) -> ColumnPredicate | None:
+        """Select rows using the truthiness of an expression such as ``r.a % 2``."""
+        if not any(
+            isinstance(child, ast.expr) and self.column(child) is not None
+            for child in ast.walk(node)
+        ):
+            # leave constants alone, like comparisons of two literals
+            return None
+        expression = self.expression(node)
+        return None if expression is None else functools.partial(_select, expression)
+
+    def comparison(
+        self, left: ast.expr, op: ast.cmpop, right: ast.expr
+    ) -> ColumnPredicate | None:
+        left_operand = self.operand(left)
+        right_operand = self.operand(right)
+        if left_operand is None or right_operand is None:
+            return None
+        if left_operand[0] is None and right_operand[0] is None:
+            return None
+        if isinstance(op, ast.In):
+            return functools.partial(
+                _compare, operator.contains, (right_operand, left_operand)
+            )
+        if isinstance(op, ast.NotIn):
+            return functools.partial(
+                _compare, _not_contains, (right_operand, left_operand)
+            )
+        return functools.partial(
+            _compare, _COMPARISONS[type(op)], (left_operand, right_operand)
+        )
+
+    def expression(self, node: ast.expr) -> ColumnExpression | None:
+        """Translate `node` into a function computing its value for every row.
+
+        Only arithmetic, unary operators and single comparisons of columns and
+        literals are translated. Boolean operators and chained comparisons are
+        not, because they don't evaluate all of their operands for every row.
+
+        """
+        column = self.column(node)
+        if column is not None:
+            return operator.itemgetter(column)
+        function: Callable[..., Any] | None
+        if isinstance(node, ast.BinOp):
+            function = _BINARY_OPERATORS.get(type(node.op))
+            operands = [self.expression(node.left), self.expression(node.right)]
+        elif isinstance(node, ast.UnaryOp):
+            function = _UNARY_OPERATORS.get(type(node.op))
+            operands = [self.expression(node.operand)]
+        elif isinstance(node, ast.Compare) and len(node.ops) == 1:
+            op = node.ops[0]
+            if isinstance(op, (ast.In, ast.NotIn)):
+                function = (
+                    operator.contains if isinstance(op, ast.In) else _not_contains
+                )
+                operands = [
+                    self.expression(node.comparators[0]),
+                    self.expression(node.left),
+                ]
+            else:
+                function = _COMPARISONS[type(op)]
+                operands = [
+                    self.expression(node.left),
+                    self.expression(node.comparators[0]),
+                ]
+        else:
+            try:
+                value = ast.literal_eval(node)
+            except ValueError:
+                return None
+            return lambda columns: itertools.repeat(value)
+        if function is None or None in operands:
+            return None
+        return functools.partial(_apply, function, operands)
+
+
+def _apply(
+    function: Callable[..., Any],
+    operands: Sequence[ColumnExpression],
+    columns: Columns,
+) -> Iterator[Any]:
+    return map(function, *(operand(columns) for operand in operands))
+
+
+def _not_contains(container: Any, value: Any) -> bool:
+    return value not in container
+
+
+def _compare(
+    function: Callable[..., Any],
+    operands: tuple[tuple[str | None, Any], ...],
+    columns: Columns,
+    indices: Indices,
+) -> Indices:
+    arguments = (
+        itertools.repeat(value) if column is None else take(columns[column], indices)
+        for column, value in operands
+    )
+    return list(itertools.compress(indices, map(function, *arguments)))
+
+
+def _select(
+    expression: ColumnExpression, columns: Columns, indices: Indices
+) -> Indices:
+    values = expression(TakenColumns(columns, indices))
+    return list(itertools.compress(indices, values))
+
+
+def _conjunction(left: ColumnPredicate, right: ColumnPredicate) -> ColumnPredicate:
+    # the right operand only sees the rows selected by the left operand, just
+    # like ``and`` short-circuits
+    return lambda columns, indices: right(columns, left(columns, indices))
+
+
+def _disjunction(left: ColumnPredicate, right: ColumnPredicate) -> ColumnPredicate:
+    def predicate(columns: Columns, indices: Indices) -> Indices:
+        selected = left(columns, indices)
+        chosen = set(selected)
+        rest = right(columns, [index for index in indices if index not in chosen])
+        return list(heapq.merge(selected, rest))
+
+    return predicate
+
+
+def _negate(operand: ColumnPredicate, columns: Columns, indices: Indices) -> Indices:
+    rejected = set(operand(columns, indices))
+    return [index for index in indices if index not in rejected]
+
+
+_compiled: weakref.WeakKeyDictionary[
+    Callable[[Any], Any], Callable[[Columns], Indices] | None
+] = weakref.WeakKeyDictionary()
+
+
+def compile_predicate(
+    predicate: Callable[[Any], Any]
+) -> Callable[[Columns], Indices] | None:
+    """Compile `predicate` into a function computing the selected row indices.
+
+    Parameters
+    ----------
+    predicate
+        A callable taking a row and returning a value whose truthiness
+        determines whether the row is selected.
+
+    Returns
+    -------
+    Callable[[Columns], Indices] | None
+        A function that takes a mapping of columns and returns the positions
+        of the rows for which `predicate` is true, in order, or :data:`None`
+        if `predicate` isn't a lambda this module knows how to compile.
+
+    """
+    try:
+        return _compiled[predicate]
+    except (KeyError, TypeError):
+        pass
+    select = _compile_predicate(predicate)
+    try:
+        _compiled[predicate] = select
+    except TypeError:
+        # not every callable can be weakly referenced
+        pass
+    return select
+
+
+def _compile_predicate(
+    predicate: Callable[[Any], Any]
+) -> Callable[[Columns], Indices] | None:
+    compiled = _column_predicate(predicate)
+    return None if compiled is None else _selector(compiled)
+
+
+def _column_predicate(predicate: Callable[[Any], Any]) -> ColumnPredicate | None:
+    node = _single_argument_lambda(predicate)
+    if node is None:
+        return None
+    return _Compiler(node.args.args[0].arg).compile(node.body)
+
+
+def _selector(compiled: ColumnPredicate) -> Callable[[Columns], Indices]:
+    def select(columns: Columns) -> Indices:
+        nrows = len(next(iter(columns.values()), ()))
+        return compiled(columns, range(nrows))
+
+    return select
+
+
+_expressions: weakref.WeakKeyDictionary[
+    Callable[[Any], Any], Callable[[Columns], list[Any]] | None
+] = weakref.WeakKeyDictionary()
+
+
+def compile_expression(
+    func: Callable[[Any], Any]
+) -> Callable[[Columns], list[Any]] | None:
+    """Compile `func` into a function computing a whole column of its values.
+
+    Parameters
+    ----------
+    func
+        A callable taking a row and returning a value.
+
+    Returns
+    -------
+    Callable[[Columns], list[Any]] | None
+        A function that takes a mapping of columns and returns the value of
+        `func` for every row, or :data:`None` if `func` isn't a column lookup
+        or a lambda computing a value from at least one column with operators
+        this module knows how to compile.
+
+    """
+    try:
+        return _expressions[func]
+    except (KeyError, TypeError):
+        pass
+    compiled = _compile_expression(func)
+    try:
+        _expressions[func] = compiled
+    except TypeError:
+        # not every callable can be weakly referenced
+        pass
+    return compiled
+
+
+def _compile_expression(
+    func: Callable[[Any], Any]
+) -> Callable[[Columns], list[Any]] | None:
+    column = getter_column(func)
+    if column is not None:
+        return functools.partial(_materialize, operator.itemgetter(column))
+    node = _single_argument_lambda(func)
+    if node is None:
+        return None
+    compiler = _Compiler(node.args.args[0].arg)
+    # a lambda of literals alone would produce an endless column
+    if not any(
+        isinstance(child, ast.expr) and compiler.column(child) is not None
+        for child in ast.walk(node.body)
+    ):
+        return None
+    expression = compiler.expression(node.body)
+    if expression is None:
+        return None
+    return functools.partial(_materialize, expression)
+
+
+def _materialize(expression: ColumnExpression, columns: Columns) -> list[Any]:
+    return list(expression(columns))
+
+
+def estimated_cost(predicate: Callable[[Any], Any]) -> int:
+    """Estimate how expensive `predicate` is to evaluate, relative to others.
+
+    Predicates that do nothing but test columns for equality or identity are
+    the cheapest, followed by any other predicate that
+    :func:`compile_predicate` accepts. Everything else is assumed to be
+    expensive.
+
+    """
+    if compile_predicate(predicate) is None:
+        return 2
+    body = typing.cast(ast.Lambda, _single_argument_lambda(predicate)).body
+    if isinstance(body, ast.Compare) and all(
+        isinstance(op, (ast.Eq, ast.NotEq, ast.Is, ast.IsNot)) for op in body.ops
+    ):
+        return 0
+    return 1
+
+
+def referenced_columns(func: Callable[[Any], Any]) -> frozenset[str] | None:
+    """Return the columns that `func` looks up in its row, if that's all it does.
+
+    Returns
+    -------
+    frozenset[str] | None
+        The names of the columns `func` reads, or :data:`None` if `func` isn't
+        a column lookup or a lambda whose row argument is only ever used to
+        look up columns by name.
+
+    """
+    column = getter_column(func)
+    if column is not None:
+        return frozenset((column,))
+    node = _single_argument_lambda(func)
+    if node is None:
+        return None
+    arg = node.args.args[0].arg
+    compiler = _Compiler(arg)
+    columns = set()
+    lookups = set()
+    for child in ast.walk(node.body):
+        if isinstance(child, (ast.Attribute, ast.Subscript)):
+            column = compiler.column(child)
+            if column is not None:
+                columns.add(column)
+                lookups.add(id(child.value))
+    if any(
+        isinstance(child, ast.Name) and child.id == arg and id(child) not in lookups
+        for child in ast.walk(node.body)
+    ):
+        # the row is used for something other than looking up a column
+        return None
+    return frozenset(columns)
+
+
+def joined_row_side(predicate: Callable[[Any], Any]) -> str | None:
+    """Return the side of a joined row that `predicate` looks at, if only one.
+
+    Returns
+    -------
+    str | None
+        ``"left"`` or ``"right"`` if `predicate` is a lambda whose row argument
+        is only ever used to access the :attr:`~stupidb.row.JoinedRow.left` or
+        :attr:`~stupidb.row.JoinedRow.right` row, or :data:`None` otherwise.
+
+    """
+    node = _single_argument_lambda(predicate)
+    if node is None:
+        return None
+    arg = node.args.args[0].arg
+    sides = set()
+    accesses = set()
+    for child in ast.walk(node.body):
+        if (
+            isinstance(child, ast.Attribute)
+            and isinstance(child.value, ast.Name)
+            and child.value.id == arg
+            and child.attr in ("left", "right")
+        ):
+            sides.add(child.attr)
+            accesses.add(id(child.value))
+    if len(sides) != 1 or any(
+        isinstance(child, ast.Name) and child.id == arg and id(child) not in accesses
+        for child in ast.walk(node.body)
+    ):
+        return None
+    (side,) = sides
+    return side
+
+
+def equi_join_columns(predicate: Callable[[Any, Any], Any]) -> tuple[str, str] | None:
+    """Return the columns that the join `predicate` tests for equality, if any.
+
+    Only lambdas of two arguments that compare a column of the first argument
+    with a column of the second, such as ``lambda l, r: l.a == r["b"]``, are
+    recognized.
+
+    Returns
+    -------
+    tuple[str, str] | None
+        The names of the column of the left and right rows, or :data:`None`
+        if `predicate` is not such an equality.
+
+    """
+    node = _positional_lambda(predicate, 2)
+    if node is None:
+        return None
+    body = node.body
+    if not (
+        isinstance(body, ast.Compare)
+        and len(body.ops) == 1
+        and isinstance(body.ops[0], ast.Eq)
+    ):
+        return None
+    left_arg, right_arg = (arg.arg for arg in node.args.args)
+    left, right = _Compiler(left_arg), _Compiler(right_arg)
+    first, second = body.left, body.comparators[0]
+    left_column, right_column = left.column(first), right.column(second)
+    if left_column is None or right_column is None:
+        left_column, right_column = left.column(second), right.column(first)
+    if left_column is None or right_column is None:
+        return None
+    return left_column, right_column
+
+
+def conjunction(predicates: Sequence[Callable[[Any], Any]]) -> Callable[[Any], Any]:
+    """Combine `predicates` into a predicate that is true when all of them are.
+
+    The predicates are evaluated in order, stopping at the first false one.
+    The result can be compiled with :func:`compile_predicate` if every one of
+    `predicates` can be.
+
+    """
+    combined = functools.reduce(_both, predicates)
+    if len(predicates) > 1:
+        compiled = list(map(_column_predicate, predicates))
+        if all(operand is not None for operand in compiled):
+            _compiled[combined] = _selector(
+                functools.reduce(_conjunction, compiled)  # type: ignore[arg-type]
+            )
+    return combined
+
+
+def _both(
+    first: Callable[[Any], Any], second: Callable[[Any], Any]
+) -> Callable[[Any], Any]:
+    return lambda row: first(row) and second(row)
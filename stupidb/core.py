@@ -14,38 +14,56 @@ from __future__ import annotations
 
 import abc
 import collections
-import functools
+import copy
 import itertools
+import operator
 import typing
-from typing import Any, Generic, Iterable, Iterator, Mapping
-
-import toolz
+from typing import (
+    Any,
+    Callable,
+    Generic,
+    Hashable,
+    Iterable,
+    Iterator,
+    Mapping,
+    Sequence,
+)
 
 from .aggregation import (
     AggregateSpecification,
     Nulls,
     WindowAggregateSpecification,
-    row_key_compare,
+    juxt,
+)
+from .columnar import (
+    TakenColumns,
+    argsort,
+    columns_getter,
+    compile_expression,
+    compile_predicate,
+    equi_join_columns,
+    getter_column,
+    getter_columns,
+    iterrows,
+    joined_row_side,
+    referenced_columns,
+    sort_indices,
+    take,
+    transpose,
 )
 from .functions.associative.core import AssociativeAggregate
 from .row import AbstractRow, JoinedRow, Row
-from .typehints import (
-    JoinPredicate,
-    OrderBy,
-    PartitionBy,
-    PartitionKey,
-    Predicate,
-    Projector,
-)
+from .typehints import JoinPredicate, OrderBy, PartitionBy, Predicate, Projector
 
 
 class Relation(abc.ABC):
     """An abstract relation."""
 
-    __slots__ = ("partitioners",)
+    __slots__ = "partitioners", "_columns_cache"
 
     def __init__(self) -> None:
         self.partitioners: Mapping[str, PartitionBy] = {}
+        self._columns_cache: tuple[Mapping[str, Sequence[Any]] | None] | None = None
 
     def __iter__(self) -> Iterator[AbstractRow]:
         """Iterate over the rows of a :class:`~stupidb.stupidb.Relation`.
@@ -53,6 +71,10 @@ class Relation(abc.ABC):
         This method will reify rows with a new row identifier equal to the row number.
 
         """
+        columns = self.columns
+        if columns is not None:
+            # rows built from columns are never empty and are already numbered
+            return iterrows(columns)
         return (
             Row.from_mapping(row, _id=id)
             for id, row in enumerate(filter(None, self._produce()))
@@ -68,6 +90,28 @@ class Relation(abc.ABC):
 
         """
 
+    @property
+    def columns(self) -> Mapping[str, Sequence[Any]] | None:
+        """Return the columns of this relation, if it's stored by column.
+
+        Relations that don't store their data in columns return :data:`None`.
+        Relations that do are iterated over directly from their columns,
+        without calling :meth:`_produce`.
+
+        The columns are computed by :meth:`_compute_columns` the first time
+        they're asked for, and reused after that, so that planning and
+        iterating over a relation more than once don't recompute them.
+
+        """
+        cache = self._columns_cache
+        if cache is None:
+            cache = self._columns_cache = (self._compute_columns(),)
+        return cache[0]
+
+    def _compute_columns(self) -> Mapping[str, Sequence[Any]] | None:
+        """Compute the columns of this relation, or :data:`None`."""
+        return None
+
     def __repr__(self) -> str:
         from stupidb.api import pretty
 
@@ -91,6 +135,56 @@ class Table(Relation):
         return iter(self.rows)
 
 
+class ColumnarTable(Relation):
+    """A relation whose data are stored as a mapping of columns.
+
+    Unlike :class:`Table`, a columnar table can be iterated over more than once
+    and exposes its :attr:`columns` so that operations such as
+    :class:`Aggregation` can consume whole columns at a time.
+
+    """
+
+    __slots__ = ("_columns",)
+
+    def __init__(self, columns: Mapping[str, Sequence[Any]]) -> None:
+        super().__init__()
+        if len({len(column) for column in columns.values()}) > 1:
+            raise ValueError("All columns must have the same length")
+        self._columns = columns
+
+    @classmethod
+    def from_mappings(cls, mappings: Sequence[Mapping[str, Any]]) -> ColumnarTable:
+        """Construct a columnar table from a sequence of mappings.
+
+        Every mapping must have the same keys.
+
+        """
+        if not mappings:
+            return cls({})
+        names = list(mappings[0])
+        # every mapping having as many keys as the first, and every one of the
+        # first's keys, means they all have the same keys; both checks run
+        # without a Python-level loop over the rows
+        error = "All rows of a columnar table must have the same keys"
+        if any(map(len(names).__ne__, map(len, mappings))):
+            raise ValueError(error)
+        try:
+            columns = {
+                name: list(map(operator.itemgetter(name), mappings)) for name in names
+            }
+        except KeyError:
+            raise ValueError(error) from None
+        return cls(columns)
+
+    @property
+    def columns(self) -> Mapping[str, Sequence[Any]]:
+        """Return the columns of this table."""
+        return self._columns
+
+    def _produce(self) -> Iterator[AbstractRow]:
+        return iterrows(self._columns)
+
+
 class Projection(Relation):
     """A relation representing column selection.
 
@@ -111,19 +205,129 @@ class Projection(Relation):
     ) -> None:
         super().__init__()
         self.child = child
-        self.aggregations: Mapping[str, WindowAggregateSpecification] = {
-            aggname: aggspec
-            for aggname, aggspec in projections.items()
-            if isinstance(aggspec, WindowAggregateSpecification)
-        }
-        self.projections: Mapping[str, Projector] = {
-            name: projector
-            for name, projector in projections.items()
-            if callable(projector)
-        }
+        # split the projections into window aggregations and plain projectors
+        # in a single pass
+        aggregations: dict[str, WindowAggregateSpecification] = {}
+        projectors: dict[str, Projector] = {}
+        for name, projector in projections.items():
+            if isinstance(projector, WindowAggregateSpecification):
+                aggregations[name] = projector
+            elif callable(projector):
+                projectors[name] = projector
+        self.aggregations: Mapping[str, WindowAggregateSpecification] = aggregations
+        self.projections: Mapping[str, Projector] = projectors
+
+    @classmethod
+    def fused(
+        cls,
+        child: Relation,
+        projections: Mapping[str, Projector | WindowAggregateSpecification],
+    ) -> Projection:
+        """Construct a projection of `child`, merging it into `child` if possible.
+
+        When `child` is a projection without window aggregations and every one
+        of `projections` looks up a column computed or passed through by
+        `child`, the two are replaced by a single projection of `child`'s own
+        child. This avoids building an intermediate row for every input row.
+
+        Likewise, when `child` is a :class:`Mutate` and none of `projections`
+        read a column that `child` computes, `projections` are computed from
+        `child`'s own child directly.
+
+        """
+        if (
+            projections
+            and isinstance(child, Projection)
+            and child.projections
+            and not child.aggregations
+        ):
+            inner = child.projections
+            columns = [
+                getter_column(projector) if callable(projector) else None
+                for projector in projections.values()
+            ]
+            if None not in columns and (
+                isinstance(child, Mutate) or inner.keys() >= set(columns)
+            ):
+                substituted = {
+                    name: inner.get(typing.cast(str, column), projector)
+                    for (name, projector), column in zip(projections.items(), columns)
+                }
+                if issubclass(cls, Mutate):
+                    substituted = {**inner, **substituted}
+                fused_cls = (
+                    Mutate
+                    if issubclass(cls, Mutate) and isinstance(child, Mutate)
+                    else Projection
+                )
+                return fused_cls(child.child, substituted)
+
+            if isinstance(child, Mutate):
+                reads = [
+                    referenced_columns(projector) if callable(projector) else None
+                    for projector in projections.values()
+                ]
+                if all(read is not None and read.isdisjoint(inner) for read in reads):
+                    if issubclass(cls, Mutate):
+                        return Mutate(child.child, {**inner, **projections})
+                    return Projection(child.child, projections)
+        return cls(child, projections)
+
+    def _compute_columns(self) -> Mapping[str, Sequence[Any]] | None:
+        """Return the projected columns if every projection can run on columns.
+
+        See :func:`~stupidb.columnar.compile_expression` for the projections
+        that can be computed a column at a time.
+
+        """
+        if self.aggregations:
+            return None
+        columns = getattr(self.child, "columns", None)
+        if columns is None:
+            return None
+        return self._project(columns)
+
+    def _project(
+        self, columns: Mapping[str, Sequence[Any]]
+    ) -> Mapping[str, Sequence[Any]] | None:
+        projections = self.projections
+        expressions = list(map(compile_expression, projections.values()))
+        if None in expressions:
+            return None
+        try:
+            return {
+                name: typing.cast(Callable[[Any], Any], expression)(columns)
+                for name, expression in zip(projections, expressions)
+            }
+        except Exception:
+            # A missing column, or a value a projection can't handle. Rows are
+            # projected one at a time instead, so that only the rows actually
+            # consumed are computed and the projections raise their own error.
+            return None
+
+    def _project_columns(
+        self, child: Iterable[AbstractRow], columns: Sequence[str]
+    ) -> Iterator[dict[str, Any]]:
+        # every projection looks up a column, so look them all up at once,
+        # directly in the underlying mapping of plain rows
+        projections = self.projections
+        projnames = projections.keys()
+        get_values = columns_getter(columns)
+        for row in child:
+            try:
+                values = get_values(row.data if type(row) is Row else row)
+            except KeyError:
+                # raise whatever error the projections themselves raise
+                values = tuple(proj(row) for proj in projections.values())
+            yield dict(zip(projnames, values))
 
     def _produce(self) -> Iterator[AbstractRow]:
         aggregations = self.aggregations
+        if not aggregations:
+            # without window aggregations there's nothing to line the
+            # projected rows up with
+            return map(Row, self._project_rows(self.child))
+
         # we need a row iterator for every aggregation to be fully generic
         # since they potentially share no structure
         #
@@ -147,28 +351,39 @@ class Projection(Relation):
             )
         )
 
-        projections = self.projections
-        projnames = projections.keys()
-        projvalues = projections.values()
-        projrows = (
-            dict(zip(projnames, (proj(row) for proj in projvalues))) for row in child
-        )
-
         # Use zip_longest here, because either of aggrows or projrows can be
         # empty
         return (
-            Row(toolz.merge(projrow, aggrow), _id=-1)
+            Row({**projrow, **aggrow}, _id=-1)
             for aggrow, projrow in itertools.zip_longest(
-                aggrows, projrows, fillvalue={}
+                aggrows, self._project_rows(child), fillvalue={}
             )
         )
 
+    def _project_rows(self, child: Iterable[AbstractRow]) -> Iterator[dict[str, Any]]:
+        projections = self.projections
+        projnames = projections.keys()
+        projvalues = projections.values()
+        names = getter_columns(projvalues) if projections else None
+        if names is None:
+            return (
+                dict(zip(projnames, [proj(row) for proj in projvalues]))
+                for row in child
+            )
+        return self._project_columns(child, names)
+
 
 class Mutate(Projection):
     """A relation representing appending columns to an existing relation."""
 
     __slots__ = ()
 
+    def _project(
+        self, columns: Mapping[str, Sequence[Any]]
+    ) -> Mapping[str, Sequence[Any]] | None:
+        computed = super()._project(columns)
+        return None if computed is None else {**columns, **computed}
+
     def _produce(self) -> Iterator[AbstractRow]:
         # reasign self.child here to avoid clobbering its iteration
         # we need to use it twice: once for the computed columns (self.child)
@@ -176,8 +391,8 @@ class Mutate(Projection):
         # original relation (child)
         child, self.child = itertools.tee(self.child)
         return (
-            Row.from_mapping(row, _id=-1)
-            for row in map(toolz.merge, child, super()._produce())
+            Row({**(row.data if type(row) is Row else row), **computed}, _id=-1)
+            for row, computed in zip(child, super()._produce())
         )
 
 
@@ -198,29 +413,101 @@ class Aggregation(Generic[AssociativeAggregate], Relation):
         ] = metrics
 
     def _produce(self) -> Iterator[AbstractRow]:
-        aggregations = self.metrics
+        child = typing.cast(Relation, self.child)
+        columns = child.columns
+        if columns is not None:
+            return self._produce_columnar(columns)
+        return self._produce_rows()
 
-        # initialize aggregates
-        grouped_aggs: Mapping[
-            PartitionKey, Mapping[str, AssociativeAggregate]
-        ] = collections.defaultdict(
-            lambda: {
-                name: aggspec.aggregate_type() for name, aggspec in aggregations.items()
-            }
-        )
+    def _produce_columnar(
+        self, columns: Mapping[str, Sequence[Any]]
+    ) -> Iterator[AbstractRow]:
+        """Aggregate whole columns of `columns` at a time.
 
+        This is only possible when every metric and every grouping key is
+        computed from columns that are looked up by name, otherwise we fall
+        back to aggregating row by row.
+
+        """
+        nrows = len(next(iter(columns.values()), ()))
+        if not nrows:
+            # like the row-wise path, an empty input produces no rows
+            return iter(())
+
+        inputs = {}
+        for name, aggspec in self.metrics.items():
+            names = aggspec.columns
+            if names is None or not all(column in columns for column in names):
+                return self._produce_rows()
+            inputs[name] = [columns[column] for column in names]
+
+        partitioners = typing.cast(Relation, self.child).partitioners
+        key_names = getter_columns(partitioners.values())
+        if key_names is None or not all(name in columns for name in key_names):
+            return self._produce_rows()
+
+        groups: Mapping[tuple[Any, ...], Sequence[int]]
+        if key_names:
+            indices: dict[tuple[Any, ...], list[int]] = collections.defaultdict(list)
+            for index, key in enumerate(zip(*map(columns.__getitem__, key_names))):
+                indices[key].append(index)
+            groups = indices
+        else:
+            groups = {(): range(nrows)}
+        return self._aggregate_groups(list(partitioners), groups, inputs)
+
+    def _aggregate_groups(
+        self,
+        key_names: Sequence[str],
+        groups: Mapping[tuple[Any, ...], Sequence[int]],
+        inputs: Mapping[str, Sequence[Sequence[Any]]],
+    ) -> Iterator[AbstractRow]:
+        metrics = self.metrics
+        for key, indices in groups.items():
+            data = dict(zip(key_names, key))
+            for name, aggspec in metrics.items():
+                agg = aggspec.aggregate_type()
+                agg.step_batch(*(take(column, indices) for column in inputs[name]))
+                data[name] = agg.finalize()
+            yield Row.from_mapping(data)
+
+    def _produce_rows(self) -> Iterator[AbstractRow]:
+        aggregations = self.metrics
         child = typing.cast(Relation, self.child)
+        partitioners = child.partitioners
+        key_names = list(partitioners)
+        key_columns = getter_columns(partitioners.values())
+        key_func = (
+            juxt(list(partitioners.values()))
+            if key_columns is None
+            else columns_getter(key_columns)
+        )
+
+        # metrics that only look up columns get their arguments with a single
+        # call per row instead of one call per getter
+        arguments = [
+            juxt(aggspec.getters)
+            if aggspec.columns is None
+            else columns_getter(aggspec.columns)
+            for aggspec in aggregations.values()
+        ]
+        aggregate_types = [aggspec.aggregate_type for aggspec in aggregations.values()]
+
+        grouped_aggs: dict[tuple[Any, ...], list[AssociativeAggregate]] = {}
         for row in child:
-            key = tuple(
-                (name, keyfunc(row)) for name, keyfunc in child.partitioners.items()
-            )
-            for name, agg in grouped_aggs[key].items():
-                inputs = (getter(row) for getter in aggregations[name].getters)
-                agg.step(*inputs)
+            key = key_func(row)
+            try:
+                aggs = grouped_aggs[key]
+            except KeyError:
+                aggs = grouped_aggs[key] = [
+                    aggregate_type() for aggregate_type in aggregate_types
+                ]
+            for agg, args in zip(aggs, arguments):
+                agg.step(*args(row))
 
         for grouping_key, aggs in grouped_aggs.items():
-            data = dict(grouping_key)
-            data.update((name, agg.finalize()) for name, agg in aggs.items())
+            data = dict(zip(key_names, grouping_key))
+            data.update(zip(aggregations, (agg.finalize() for agg in aggs)))
             yield Row.from_mapping(data)
 
 
@@ -242,6 +529,66 @@ class Selection(Relation):
         self.child = child
         self.predicate = predicate
 
+    @classmethod
+    def pushed(cls, child: Relation, predicate: Predicate) -> Relation:
+        """Construct a selection of `child`, filtering the inputs of `child` if possible.
+
+        Filtering commutes with set operations, so when `child` is a set
+        operation the selection is applied to each of its inputs instead,
+        which means fewer rows are hashed and compared. This is only done for
+        predicates that :func:`~stupidb.columnar.compile_predicate` accepts,
+        which are known to do nothing but compare column values, because the
+        predicate may end up being called on more rows than it otherwise would.
+
+        When `child` is a join and the predicate only looks at one side of the
+        joined rows, that side's input rows are filtered before joining. When
+        `child` is a :class:`GroupBy`, the rows are filtered before grouping,
+        so that the grouping is kept.
+
+        """
+        if isinstance(child, GroupBy):
+            return GroupBy(cls.pushed(child.child, predicate), child.partitioners)
+        if isinstance(child, Join):
+            side = joined_row_side(predicate)
+            if side is not None:
+                filtered = child.filtered(side, predicate)
+                if filtered is not None:
+                    return filtered
+        if (
+            isinstance(child, SetOperation)
+            # plain iterables produce plain mappings, not rows
+            and isinstance(child.left, Relation)
+            and isinstance(child.right, Relation)
+            and compile_predicate(predicate) is not None
+        ):
+            return type(child)(
+                cls.pushed(child.left, predicate), cls.pushed(child.right, predicate)
+            )
+        return cls(child, predicate)
+
+    def _compute_columns(self) -> Mapping[str, Sequence[Any]] | None:
+        """Return the selected columns if the predicate can run on columns.
+
+        See Also
+        --------
+        stupidb.columnar.compile_predicate
+
+        """
+        columns = getattr(self.child, "columns", None)
+        if columns is None:
+            return None
+        select = compile_predicate(self.predicate)
+        if select is None:
+            return None
+        try:
+            indices = select(columns)
+        except Exception:
+            # A missing column, or a value the predicate can't handle. Filter
+            # rows one at a time instead, so that only the rows actually
+            # consumed are tested and the predicate raises its own error.
+            return None
+        return TakenColumns(columns, indices)
+
     def _produce(self) -> Iterator[AbstractRow]:
         return filter(self.predicate, self.child)
 
@@ -251,19 +598,24 @@ class GroupBy(Relation):
 
     Attributes
     ----------
-    group_by
-        A callable that takes an :class:`~stupidb.row.AbstractRow` and returns
-        an instance of :class:`typing.Hashable`.
+    partitioners
+        A mapping from group key names to callables that take an
+        :class:`~stupidb.row.AbstractRow` and return an instance of
+        :class:`typing.Hashable`.
 
     """
 
-    __slots__ = "child", "group_by", "partitioners"
+    __slots__ = "child", "partitioners"
 
     def __init__(self, child: Relation, group_by: Mapping[str, PartitionBy]) -> None:
         super().__init__()
         self.child = child
         self.partitioners = group_by
 
+    def _compute_columns(self) -> Mapping[str, Sequence[Any]] | None:
+        """Return the columns of the child, which grouping doesn't change."""
+        return getattr(self.child, "columns", None)
+
     def _produce(self) -> Iterator[AbstractRow]:
         return iter(self.child)
 
@@ -291,19 +643,29 @@ class SortBy(Relation):
         self.order_by = order_by
         self.null_ordering = null_ordering
 
+    def _compute_columns(self) -> Mapping[str, Sequence[Any]] | None:
+        """Return the sorted columns if every sort key is a column."""
+        columns = getattr(self.child, "columns", None)
+        if columns is None:
+            return None
+        names = list(map(getter_column, self.order_by))
+        if not all(name in columns for name in names):
+            return None
+        indices = sort_indices(
+            columns,
+            typing.cast(typing.List[str], names),
+            nulls_first=self.null_ordering is Nulls.FIRST,
+        )
+        return {name: take(column, indices) for name, column in columns.items()}
+
     def _produce(self) -> Iterator[AbstractRow]:
-        return iter(
-            sorted(
-                self.child,
-                key=functools.cmp_to_key(
-                    functools.partial(
-                        row_key_compare,
-                        toolz.juxt(*self.order_by),
-                        self.null_ordering,
-                    )
-                ),
-            )
+        # compute every row's key once, instead of once per comparison
+        rows = list(self.child)
+        indices = argsort(
+            list(map(juxt(self.order_by), rows)),
+            nulls_first=self.null_ordering is Nulls.FIRST,
         )
+        return map(rows.__getitem__, indices)
 
 
 class Limit(Relation):
@@ -326,25 +688,106 @@ class Limit(Relation):
 
 
 class Join(Relation):
-    __slots__ = "grouped", "rows"
+    __slots__ = "left_rows", "right_rows"
+
+    # the sides of a joined row whose input rows can be filtered before
+    # joining, mapped to the attribute holding those input rows
+    _filterable: typing.ClassVar[Mapping[str, str]] = {
+        "left": "left_rows",
+        "right": "right_rows",
+    }
 
     def __init__(self, left: Relation, right: Relation) -> None:
         super().__init__()
-        self.grouped = itertools.groupby(
-            (
-                JoinedRow(left_row, right_row, _id=-1)
-                for left_row, right_row in itertools.product(left, right)
-            ),
-            key=lambda row: row.left,
-        )
-        self.rows = itertools.chain.from_iterable(rows for _, rows in self.grouped)
+        # Wrap each child row once up front so the probe loops below only
+        # build a JoinedRow for pairs that survive the join predicate.
+        self.left_rows = tuple(map(Row.from_mapping, left))
+        self.right_rows = tuple(map(Row.from_mapping, right))
+
+    def filtered(self, side: str, predicate: Predicate) -> Join | None:
+        """Return a copy of this join with one side's input rows filtered.
+
+        Parameters
+        ----------
+        side
+            Either ``"left"`` or ``"right"``.
+        predicate
+            A predicate taking a :class:`~stupidb.row.JoinedRow` that only
+            looks at its `side`.
+
+        Returns
+        -------
+        Join | None
+            The filtered join, or :data:`None` if filtering `side` before
+            joining would change the result, as it would for the side of an
+            outer join that is padded with nulls.
+
+        """
+        attribute = self._filterable.get(side)
+        if attribute is None:
+            return None
+        rows: tuple[AbstractRow, ...] = getattr(self, attribute)
+        if side == "left":
+            selected = (row for row in rows if predicate(JoinedRow(row, {})))
+        else:
+            selected = (row for row in rows if predicate(JoinedRow({}, row)))
+        joined = copy.copy(self)
+        setattr(joined, attribute, tuple(selected))
+        return joined
+
+    def _matcher(
+        self, predicate: JoinPredicate
+    ) -> Callable[[AbstractRow], Iterable[AbstractRow]]:
+        """Return a function that finds the right rows matching a left row.
+
+        When `predicate` tests a column of each side for equality the right
+        rows are indexed by their key, so each left row is matched with a
+        single lookup instead of a scan of every right row. Matches are
+        produced in the order of the right rows either way.
+
+        """
+        right_rows = self.right_rows
+
+        def scan(left_row: AbstractRow) -> list[AbstractRow]:
+            return [
+                right_row for right_row in right_rows if predicate(left_row, right_row)
+            ]
+
+        columns = equi_join_columns(predicate)
+        if columns is None:
+            return scan
+
+        left_column, right_column = columns
+        index: dict[Any, list[AbstractRow]] = collections.defaultdict(list)
+        try:
+            for right_row in right_rows:
+                key = right_row[right_column]
+                # values that aren't equal to themselves, like NaN, never match
+                if key == key:
+                    index[key].append(right_row)
+        except (KeyError, TypeError, ValueError):
+            # let the predicate raise or decide what to do with these rows
+            return scan
+
+        def lookup(left_row: AbstractRow) -> Iterable[AbstractRow]:
+            try:
+                return index.get(left_row[left_column], ())
+            except (KeyError, TypeError, ValueError):
+                return scan(left_row)
+
+        return lookup
 
 
 class CrossJoin(Join):
     __slots__ = ()
 
     def _produce(self) -> Iterator[AbstractRow]:
-        return iter(self.rows)
+        return (
+            JoinedRow(left_row, right_row, _id=-1)
+            for left_row, right_row in itertools.product(
+                self.left_rows, self.right_rows
+            )
+        )
 
 
 class InnerJoin(Join):
@@ -357,12 +800,19 @@ class InnerJoin(Join):
         self.predicate = predicate
 
     def _produce(self) -> Iterator[AbstractRow]:
-        return (row for row in self.rows if self.predicate(row.left, row.right))
+        matches = self._matcher(self.predicate)
+        return (
+            JoinedRow(left_row, right_row, _id=-1)
+            for left_row in self.left_rows
+            for right_row in matches(left_row)
+        )
 
 
 class LeftJoin(Join):
     __slots__ = ("predicate",)
 
+    _filterable = {"left": "left_rows"}
+
     def __init__(
         self, left: Relation, right: Relation, predicate: JoinPredicate
     ) -> None:
@@ -370,21 +820,27 @@ class LeftJoin(Join):
         self.predicate = predicate
 
     def _produce(self) -> Iterator[AbstractRow]:
-        for left_row, joined_rows in self.grouped:
+        right_rows = self.right_rows
+        if not right_rows:
+            return
+        matches = self._matcher(self.predicate)
+        columns = tuple(right_rows[-1])
+        for left_row in self.left_rows:
             matched = False
 
-            for joined_row in joined_rows:
-                right_row = joined_row.right
-                if self.predicate(left_row, right_row):
-                    matched = True
-                    yield JoinedRow(left_row, right_row, _id=-1)
+            for right_row in matches(left_row):
+                matched = True
+                yield JoinedRow(left_row, right_row, _id=-1)
             if not matched:
-                yield JoinedRow(left_row, dict.fromkeys(right_row), _id=-1)
+                yield JoinedRow(left_row, dict.fromkeys(columns), _id=-1)
 
 
 class RightJoin(LeftJoin):
     __slots__ = ()
 
+    # the right join is a left join with its inputs swapped
+    _filterable = {"right": "left_rows"}
+
     def __init__(
         self, left: Relation, right: Relation, predicate: JoinPredicate
     ) -> None:
@@ -405,6 +861,25 @@ class SetOperation(Relation):
         self.left = left
         self.right = right
 
+    @classmethod
+    def folded(cls, left: Relation, right: Relation) -> Relation:
+        """Construct a set operation, simplifying it if both inputs are the same.
+
+        Relations can usually only be iterated over once, so a set operation of
+        a relation with itself would otherwise see an empty right-hand side.
+
+        """
+        if left is right:
+            folded = cls._fold(left)
+            if folded is not None:
+                return folded
+        return cls(left, right)
+
+    @classmethod
+    def _fold(cls, relation: Relation) -> Relation | None:
+        """Return the result of combining `relation` with itself, if known."""
+        return None
+
     @staticmethod
     def itemize(
         mappings: Iterable[AbstractRow],
@@ -412,25 +887,80 @@ class SetOperation(Relation):
         """Return a hashable version of `mappings`."""
         return frozenset(tuple(mapping.items()) for mapping in mappings)
 
+    @staticmethod
+    def unique(
+        rows: Iterable[AbstractRow],
+        key: Callable[[AbstractRow], Hashable] = lambda row: row,
+    ) -> Iterator[AbstractRow]:
+        """Yield the rows of `rows` whose `key` hasn't been seen before."""
+        seen = set()
+        for row in rows:
+            row_key = key(row)
+            if row_key not in seen:
+                seen.add(row_key)
+                yield row
+
+    def _compute_columns(self) -> Mapping[str, Sequence[Any]] | None:
+        """Return the result as columns if both inputs have the same columns.
+
+        Rows are compared as tuples of values, which is only equivalent to
+        comparing their items when both sides have the same column names in
+        the same order.
+
+        """
+        left = getattr(self.left, "columns", None)
+        right = getattr(self.right, "columns", None)
+        if left is None or right is None or list(left) != list(right):
+            return None
+        rows = self._combine(zip(*left.values()), zip(*right.values()))
+        return transpose(list(left), rows)
+
+    @abc.abstractmethod
+    def _combine(
+        self, left: Iterator[tuple[Any, ...]], right: Iterator[tuple[Any, ...]]
+    ) -> Iterable[tuple[Any, ...]]:
+        """Combine the rows of two relations that have the same columns."""
+
+    @abc.abstractmethod
+    def _produce_rows(self) -> Iterator[AbstractRow]:
+        """Combine the rows of two arbitrary relations."""
+
+    def _produce(self) -> Iterator[AbstractRow]:
+        return self._produce_rows()
+
 
 class Union(SetOperation):
     """Union between two relations."""
 
     __slots__ = ()
 
-    def _produce(self) -> Iterator[AbstractRow]:
-        return toolz.unique(
+    def _combine(
+        self, left: Iterator[tuple[Any, ...]], right: Iterator[tuple[Any, ...]]
+    ) -> Iterable[tuple[Any, ...]]:
+        return dict.fromkeys(itertools.chain(left, right))
+
+    def _produce_rows(self) -> Iterator[AbstractRow]:
+        return self.unique(
             itertools.chain(self.left, self.right),
             key=lambda row: frozenset(row.items()),
         )
 
+    @classmethod
+    def _fold(cls, relation: Relation) -> Relation | None:
+        return Union(relation, Table(()))
+
 
 class UnionAll(SetOperation):
     """Non-unique union between two relations."""
 
     __slots__ = ()
 
-    def _produce(self) -> Iterator[AbstractRow]:
+    def _combine(
+        self, left: Iterator[tuple[Any, ...]], right: Iterator[tuple[Any, ...]]
+    ) -> Iterable[tuple[Any, ...]]:
+        return itertools.chain(left, right)
+
+    def _produce_rows(self) -> Iterator[AbstractRow]:
         return itertools.chain(self.left, self.right)
 
 
@@ -439,7 +969,17 @@ class IntersectAll(SetOperation):
 
     __slots__ = ()
 
-    def _produce(self) -> Iterator[AbstractRow]:
+    def _combine(
+        self, left: Iterator[tuple[Any, ...]], right: Iterator[tuple[Any, ...]]
+    ) -> Iterable[tuple[Any, ...]]:
+        left_rows = dict.fromkeys(left)
+        right_rows = dict.fromkeys(right)
+        return itertools.chain(
+            (row for row in left_rows if row in right_rows),
+            (row for row in right_rows if row in left_rows),
+        )
+
+    def _produce_rows(self) -> Iterator[AbstractRow]:
         left_set = self.itemize(self.left)
         right_set = self.itemize(self.right)
         left_filtered = (row_items for row_items in left_set if row_items in right_set)
@@ -455,36 +995,66 @@ class Intersect(SetOperation):
 
     __slots__ = ()
 
-    def _produce(self) -> Iterator[AbstractRow]:
+    def _combine(
+        self, left: Iterator[tuple[Any, ...]], right: Iterator[tuple[Any, ...]]
+    ) -> Iterable[tuple[Any, ...]]:
+        right_rows = frozenset(right)
+        return dict.fromkeys(row for row in left if row in right_rows)
+
+    def _produce_rows(self) -> Iterator[AbstractRow]:
         return (
             Row.from_mapping(dict(row))
             for row in self.itemize(self.left) & self.itemize(self.right)
         )
 
+    @classmethod
+    def _fold(cls, relation: Relation) -> Relation | None:
+        return Union(relation, Table(()))
+
 
 class Difference(SetOperation):
     """Unique difference between two relations."""
 
     __slots__ = ()
 
-    def _produce(self) -> Iterator[AbstractRow]:
+    def _combine(
+        self, left: Iterator[tuple[Any, ...]], right: Iterator[tuple[Any, ...]]
+    ) -> Iterable[tuple[Any, ...]]:
+        right_rows = frozenset(right)
+        return dict.fromkeys(row for row in left if row not in right_rows)
+
+    def _produce_rows(self) -> Iterator[AbstractRow]:
         right_set = self.itemize(self.right)
-        return toolz.unique(
+        return self.unique(
             Row.from_mapping(dict(row_items))
             for row_items in (tuple(row.items()) for row in self.left)
             if row_items not in right_set
         )
 
+    @classmethod
+    def _fold(cls, relation: Relation) -> Relation | None:
+        return Table(())
+
 
 class DifferenceAll(SetOperation):
     """Non-unique difference between two relations."""
 
     __slots__ = ()
 
-    def _produce(self) -> Iterator[AbstractRow]:
+    def _combine(
+        self, left: Iterator[tuple[Any, ...]], right: Iterator[tuple[Any, ...]]
+    ) -> Iterable[tuple[Any, ...]]:
+        right_rows = frozenset(right)
+        return (row for row in left if row not in right_rows)
+
+    def _produce_rows(self) -> Iterator[AbstractRow]:
         right_set = self.itemize(self.right)
         return (
             Row.from_mapping(dict(row_items))
             for row_items in (tuple(row.items()) for row in self.left)
             if row_items not in right_set
         )
+
+    @classmethod
+    def _fold(cls, relation: Relation) -> Relation | None:
+        return Table(())
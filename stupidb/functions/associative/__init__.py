@@ -62,9 +62,12 @@ specific aggregate to achieve optimal behavior from all aggregates.
 
 from __future__ import annotations
 
+import functools
+import itertools
 import math
+import operator
 import typing
-from typing import Callable, TypeVar
+from typing import Callable, Iterable, TypeVar
 
 from ...protocols import Comparable
 from ...typehints import R1, R2, Input1, R
@@ -74,15 +77,16 @@ from ..associative.core import BinaryAssociativeAggregate, UnaryAssociativeAggre
 class Count(UnaryAssociativeAggregate[Input1, int]):
     """Count column values."""
 
-    __slots__ = ("count",)
-
-    def __init__(self) -> None:
-        self.count = 0
+    __slots__ = ()
 
     def step(self, input1: Input1 | None) -> None:
         """Add one to the count if `input1` is not :data:`None`."""
         self.count += input1 is not None
 
+    def step_batch(self, inputs1: Iterable[Input1 | None]) -> None:
+        """Add the number of non-null values in `inputs1` to the count."""
+        self.count += sum(map(operator.is_not, inputs1, itertools.repeat(None)))
+
     def __repr__(self) -> str:
         return f"{type(self).__name__}(count={self.count!r})"
 
@@ -96,14 +100,21 @@ class Count(UnaryAssociativeAggregate[Input1, int]):
 
 
 class Sum(UnaryAssociativeAggregate[R1, R2]):
-    """Sum column values, ignoring nulls."""
+    """Sum column values, ignoring nulls.
+
+    Values are accumulated with Neumaier's compensated summation, so the
+    rounding error of a floating point sum doesn't grow with the number of
+    values or with the number of segment tree nodes combined to compute it.
+
+    """
 
-    __slots__ = "count", "total"
+    __slots__ = "total", "compensation"
 
     def __init__(self) -> None:
         super().__init__()
-        self.total = typing.cast(R2, 0)
-        self.count = 0
+        # plain literals: this runs once for every node of a segment tree
+        self.total: R2 = 0  # type: ignore[assignment]
+        self.compensation: R2 = 0  # type: ignore[assignment]
 
     def __repr__(self) -> str:
         name = type(self).__name__
@@ -111,16 +122,54 @@ class Sum(UnaryAssociativeAggregate[R1, R2]):
         total = self.finalize()
         return f"{name}(total={total!r}, count={count!r})"
 
+    def _add(self, value: R2) -> None:
+        total = self.total
+        new_total = total + value
+        # inf - inf is nan, so the compensation of a total that isn't finite
+        # would turn an infinite sum into nan: leave it alone
+        if new_total == new_total and abs(new_total) != math.inf:
+            if abs(total) >= abs(value):
+                self.compensation += (total - new_total) + value
+            else:
+                self.compensation += (value - new_total) + total
+        self.total = new_total
+
     def step(self, input1: R1 | None) -> None:
         if input1 is not None:
-            self.total += input1
+            self._add(typing.cast(R2, input1))
             self.count += 1
 
+    def step_batch(self, inputs1: Iterable[R1 | None]) -> None:
+        values = [input1 for input1 in inputs1 if input1 is not None]
+        if not values:
+            return
+        add = self._add
+        types = set(map(type, values))
+        if types <= {int, bool}:
+            # integer sums are exact, no need to compensate them
+            add(typing.cast(R2, sum(values)))
+            self.count += len(values)
+            return
+        if types == {float}:
+            # a correctly rounded sum only needs to be compensated once
+            try:
+                add(typing.cast(R2, math.fsum(typing.cast(Iterable[float], values))))
+            except (ValueError, OverflowError):
+                # infinities of both signs or an overflowing partial sum
+                pass
+            else:
+                self.count += len(values)
+                return
+        for value in values:
+            add(typing.cast(R2, value))
+        self.count += len(values)
+
     def finalize(self) -> R2 | None:
-        return self.total if self.count else None
+        return self.total + self.compensation if self.count else None
 
     def combine(self: Sum[R1, R2], other: Sum[R1, R2]) -> None:
-        self.total += other.total
+        self._add(other.total)
+        self.compensation += other.compensation
         self.count += other.count
 
 
@@ -130,7 +179,9 @@ class Total(Sum[R1, R2]):
     __slots__ = ()
 
     def finalize(self) -> R2 | None:
-        return self.total if self.count else typing.cast(R2, 0)
+        if not self.count:
+            return 0  # type: ignore[return-value]
+        return self.total + self.compensation
 
 
 class Mean(Sum[R1, R2]):
@@ -140,7 +191,7 @@ class Mean(Sum[R1, R2]):
 
     def finalize(self) -> R2 | None:
         count = self.count
-        return self.total / count if count > 0 else None
+        return (self.total + self.compensation) / count if count > 0 else None
 
     def __repr__(self) -> str:
         name = type(self).__name__
@@ -164,12 +215,29 @@ class MinMax(UnaryAssociativeAggregate[C, C]):
         self.comparator = comparator
 
     def step(self, input1: C | None) -> None:
+        # Min and Max override this, and combine, with an inlined comparison
         if input1 is not None:
             if self.current_value is None:
                 self.current_value = input1
             else:
                 self.current_value = self.comparator(self.current_value, input1)
 
+    def step_batch(self, inputs1: Iterable[C | None]) -> None:
+        values = [input1 for input1 in inputs1 if input1 is not None]
+        if not values:
+            return
+        current_value = self.current_value
+        if current_value is not None:
+            values.insert(0, current_value)
+        # reduce the whole batch in a single call when possible, min and max
+        # accept an iterable as well as two arguments
+        comparator = self.comparator
+        if comparator is min or comparator is max:
+            reduce = typing.cast(Callable[[Iterable[C]], C], comparator)
+            self.current_value = reduce(values)
+        else:
+            self.current_value = functools.reduce(comparator, values)
+
     def finalize(self) -> C | None:
         return self.current_value
 
@@ -197,6 +265,19 @@ class Min(MinMax):
     def __init__(self) -> None:
         super().__init__(comparator=min)
 
+    def step(self, input1: C | None) -> None:
+        if input1 is not None:
+            current_value = self.current_value
+            if current_value is None or input1 < current_value:
+                self.current_value = input1
+
+    def combine(self, other: MinMax) -> None:
+        other_value = other.current_value
+        if other_value is not None:
+            current_value = self.current_value
+            if current_value is None or other_value < current_value:
+                self.current_value = other_value
+
 
 class Max(MinMax):
     """Maximum of column values."""
@@ -206,15 +287,27 @@ class Max(MinMax):
     def __init__(self) -> None:
         super().__init__(comparator=max)
 
+    def step(self, input1: C | None) -> None:
+        if input1 is not None:
+            current_value = self.current_value
+            if current_value is None or input1 > current_value:
+                self.current_value = input1
+
+    def combine(self, other: MinMax) -> None:
+        other_value = other.current_value
+        if other_value is not None:
+            current_value = self.current_value
+            if current_value is None or other_value > current_value:
+                self.current_value = other_value
+
 
 class Covariance(BinaryAssociativeAggregate[R1, R2, float]):
     """Base class modeling the covariance of two columns."""
 
-    __slots__ = "count", "mean_x", "mean_y", "cov", "ddof"
+    __slots__ = "mean_x", "mean_y", "cov", "ddof"
 
     def __init__(self, *, ddof: int) -> None:
         super().__init__()
-        self.count = 0
         self.mean_x = 0.0
         self.mean_y = 0.0
         self.cov = 0.0
@@ -232,25 +325,43 @@ class Covariance(BinaryAssociativeAggregate[R1, R2, float]):
             self.count += 1
             count = self.count
             delta_x = x - self.mean_x
-            self.mean_x += delta_x + count
+            self.mean_x += delta_x / count
             self.mean_y += (y - self.mean_y) / count
             self.cov += delta_x * (y - self.mean_y)
 
+    def step_batch(self, xs: Iterable[R1 | None], ys: Iterable[R2 | None]) -> None:
+        # The same update as `step`, with the state kept in locals for the
+        # duration of the loop instead of being read and written through
+        # attributes for every pair.
+        count = self.count
+        mean_x = self.mean_x
+        mean_y = self.mean_y
+        cov = self.cov
+        for x, y in zip(xs, ys):
+            if x is not None and y is not None:
+                count += 1
+                delta_x = x - mean_x
+                mean_x += delta_x / count
+                mean_y += (y - mean_y) / count
+                cov += delta_x * (y - mean_y)
+        self.count = count
+        self.mean_x = mean_x
+        self.mean_y = mean_y
+        self.cov = cov
+
     def finalize(self) -> float | None:
         denom = self.count - self.ddof
         return self.cov / denom if denom > 0 else None
 
     def combine(self, other: Covariance[R1, R2]) -> None:
         count = self.count + other.count
-        self.cov += (
-            other.cov
-            + (self.mean_x - other.mean_x)
-            * (self.mean_y - other.mean_y)
-            * (self.count * other.count)
-            / count
-        )
-        self.mean_x = (self.count * self.mean_x + other.count * other.mean_x) / count
-        self.mean_y = (self.count * self.mean_y + other.count * other.mean_y) / count
+        if not count:
+            return
+        delta_x = other.mean_x - self.mean_x
+        delta_y = other.mean_y - self.mean_y
+        self.cov += other.cov + delta_x * delta_y * self.count * other.count / count
+        self.mean_x += delta_x * other.count / count
+        self.mean_y += delta_y * other.count / count
         self.count = count
 
 
@@ -275,19 +386,51 @@ class PopulationCovariance(Covariance[R1, R2]):
 class Variance(UnaryAssociativeAggregate[R, float]):
     """Base class modeling the variance of a column."""
 
-    __slots__ = ("aggregator",)
+    __slots__ = "mean", "m2", "ddof"
+
+    def __init__(self, *, ddof: int) -> None:
+        super().__init__()
+        self.mean = 0.0
+        self.m2 = 0.0
+        self.ddof = ddof
 
-    def __init__(self, ddof: int) -> None:
-        self.aggregator = Covariance[R, R](ddof=ddof)
+    def __repr__(self) -> str:
+        name = type(self).__name__
+        return f"{name}(mean={self.mean!r}, m2={self.m2!r}, count={self.count!r})"
 
     def step(self, x: R | None) -> None:
-        self.aggregator.step(x, x)
+        if x is not None:
+            self.count += 1
+            delta = x - self.mean
+            self.mean += delta / self.count
+            self.m2 += delta * (x - self.mean)
+
+    def step_batch(self, xs: Iterable[R | None]) -> None:
+        count = self.count
+        mean = self.mean
+        m2 = self.m2
+        for x in xs:
+            if x is not None:
+                count += 1
+                delta = x - mean
+                mean += delta / count
+                m2 += delta * (x - mean)
+        self.count = count
+        self.mean = mean
+        self.m2 = m2
 
     def finalize(self) -> float | None:
-        return self.aggregator.finalize()
+        denom = self.count - self.ddof
+        return self.m2 / denom if denom > 0 else None
 
     def combine(self, other: Variance[R]) -> None:
-        self.aggregator.combine(other.aggregator)
+        count = self.count + other.count
+        if not count:
+            return
+        delta = other.mean - self.mean
+        self.m2 += other.m2 + delta * delta * self.count * other.count / count
+        self.mean += delta * other.count / count
+        self.count = count
 
 
 class SampleVariance(Variance[R]):
@@ -311,7 +454,7 @@ class PopulationVariance(Variance[R]):
 class StandardDeviation(Variance[R]):
     """Base class modeling the standard deviation of a column."""
 
-    __slots__ = ("aggregator",)
+    __slots__ = ()
 
     def finalize(self) -> float | None:
         variance = super().finalize()
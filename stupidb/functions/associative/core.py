@@ -1,7 +1,7 @@
 from __future__ import annotations
 
 import abc
-from typing import Generic, Sequence, TypeVar
+from typing import Generic, Iterable, Sequence, TypeVar
 
 from ...aggregator import Aggregate, Aggregator
 from ...typehints import Input1, Input2, Output, T
@@ -44,6 +44,16 @@ class UnaryAssociativeAggregate(
     def step(self, input1: Input1 | None) -> None:
         """Perform a single step of the aggregation."""
 
+    def step_batch(self, inputs1: Iterable[Input1 | None]) -> None:
+        """Perform one step of the aggregation for each element of `inputs1`.
+
+        Subclasses can override this to aggregate a whole column at once.
+
+        """
+        step = self.step
+        for input1 in inputs1:
+            step(input1)
+
     @abc.abstractmethod
     def combine(self: UA, other: UA) -> None:
         """Combine two UnaryAssociativeAggregate instances."""
@@ -65,6 +75,18 @@ class BinaryAssociativeAggregate(
     def step(self, input1: Input1 | None, input2: Input2 | None) -> None:
         """Perform a single step of the aggregation."""
 
+    def step_batch(
+        self, inputs1: Iterable[Input1 | None], inputs2: Iterable[Input2 | None]
+    ) -> None:
+        """Perform one step of the aggregation for each pair of inputs.
+
+        Subclasses can override this to aggregate whole columns at once.
+
+        """
+        step = self.step
+        for input1, input2 in zip(inputs1, inputs2):
+            step(input1, input2)
+
     @abc.abstractmethod
     def combine(self: BA, other: BA) -> None:
         """Combine two BinaryAssociativeAggregate instances."""
@@ -2,10 +2,13 @@
 
 from __future__ import annotations
 
+import itertools
 import operator
 from typing import Callable, ClassVar, MutableMapping, Sequence
 
-from ...typehints import Input
+from ...aggregator import Aggregate, Aggregator
+from ...row import AbstractRow
+from ...typehints import Getter, Input
 from .core import (
     BinaryNavigationAggregate,
     TernaryNavigationAggregate,
@@ -13,6 +16,16 @@ from .core import (
 )
 
 
+def default_offset(_: AbstractRow) -> int:
+    """Return the default offset of a lead or lag, which is one row."""
+    return 1
+
+
+def default_value(_: AbstractRow) -> None:
+    """Return the default value of a lead or lag, which is NULL."""
+    return None
+
+
 class LeadLag(TernaryNavigationAggregate[Input, int, Input, Input]):
     """Base class for shifting operations.
 
@@ -37,6 +50,36 @@ class LeadLag(TernaryNavigationAggregate[Input, int, Input, Input]):
         self.index = 0
         self.ninputs = len(inputs)
 
+    @classmethod
+    def prepare(
+        cls,
+        possible_peers: Sequence[AbstractRow],
+        getters: tuple[Getter, ...],
+        order_by_columns: Sequence[str],
+    ) -> Aggregator[Aggregate[Input], Input]:
+        """Prepare a lead or lag, skipping calls to the default getters.
+
+        The offset and default getters are almost always the defaults, whose
+        values are known without calling them once per row.
+
+        """
+        getter, offset_getter, default_getter = getters
+        if offset_getter is not default_offset and default_getter is not default_value:
+            return super().prepare(possible_peers, getters, order_by_columns)
+
+        inputs = map(getter, possible_peers)
+        offsets = (
+            itertools.repeat(1)
+            if offset_getter is default_offset
+            else map(offset_getter, possible_peers)
+        )
+        defaults = (
+            itertools.repeat(None)
+            if default_getter is default_value
+            else map(default_getter, possible_peers)
+        )
+        return cls.aggregator_class(list(zip(inputs, offsets, defaults)))
+
     def execute(self, begin: int, end: int) -> Input | None:
         """Compute the value of the navigation function `lead` or `lag`.
 
@@ -64,11 +107,40 @@ class Lead(LeadLag[Input]):
     __slots__ = ()
     offset_operation = operator.add
 
+    @classmethod
+    def partition_values(
+        cls,
+        possible_peers: Sequence[AbstractRow],
+        getters: tuple[Getter, ...],
+    ) -> Sequence[Input | None] | None:
+        """Shift a partition up by one row when using the default offset."""
+        getter, offset_getter, default_getter = getters
+        if offset_getter is not default_offset or not possible_peers:
+            return None
+        values = list(map(getter, possible_peers))
+        del values[0]
+        values.append(default_getter(possible_peers[-1]))
+        return values
+
 
 class Lag(LeadLag[Input]):
     __slots__ = ()
     offset_operation = operator.sub
 
+    @classmethod
+    def partition_values(
+        cls,
+        possible_peers: Sequence[AbstractRow],
+        getters: tuple[Getter, ...],
+    ) -> Sequence[Input | None] | None:
+        """Shift a partition down by one row when using the default offset."""
+        getter, offset_getter, default_getter = getters
+        if offset_getter is not default_offset or not possible_peers:
+            return None
+        values = list(map(getter, possible_peers[:-1]))
+        values.insert(0, default_getter(possible_peers[0]))
+        return values
+
 
 class FirstLast(UnaryNavigationAggregate[Input, Input]):
     """Base class for first and last navigation functions.
@@ -6,7 +6,8 @@ import abc
 from typing import Any, Sequence, Union
 
 from ...protocols import Comparable
-from ...typehints import T
+from ...row import AbstractRow
+from ...typehints import Getter, T
 from .core import RankingAggregate
 
 
@@ -27,6 +28,15 @@ class RowNumber(RankingAggregate[int]):
         self.row_number += 1
         return row_number
 
+    @classmethod
+    def partition_values(
+        cls,
+        possible_peers: Sequence[AbstractRow],
+        getters: tuple[Getter, ...],
+    ) -> Sequence[int] | None:
+        """Number the rows of a partition, which ignores the window frame."""
+        return range(len(possible_peers))
+
 
 class Sentinel:
     """A class that is not equal to anything except instances of itself.
@@ -61,6 +71,15 @@ class AbstractRank(RowNumber):
         super().__init__(order_by_values)
         self.previous_value: Either | None = Sentinel()
 
+    @classmethod
+    def partition_values(
+        cls,
+        possible_peers: Sequence[AbstractRow],
+        getters: tuple[Getter, ...],
+    ) -> Sequence[int] | None:
+        """Rank rows one at a time, since ranks depend on the previous row."""
+        return None
+
     @abc.abstractmethod
     def rank(self, current_order_by_value: Comparable, current_row_number: int) -> int:
         """Compute the rank of the current row."""
@@ -3,10 +3,9 @@
 from __future__ import annotations
 
 import abc
+import typing
 from typing import Any, Hashable, Iterator, Mapping
 
-import toolz
-
 
 class AbstractRow(Mapping[str, Any], Hashable, abc.ABC):
     """The base immutable row type of StupidDB.
@@ -25,9 +24,10 @@ class AbstractRow(Mapping[str, Any], Hashable, abc.ABC):
         The index of this row in a table. This a private field whose details
         are subject to change without notice.
     _hash
-        The hash of the row's data. This stored on the instance to avoid
-        recomputation in :class:`~stupidb.stupidb.SetOperation` instances, for
-        example.
+        The hash of the row's data, or :data:`None` if it hasn't been needed
+        yet. This is computed lazily, since most rows are never hashed, and
+        stored on the instance to avoid recomputation in
+        :class:`~stupidb.stupidb.SetOperation` instances, for example.
 
     """
 
@@ -52,16 +52,15 @@ class AbstractRow(Mapping[str, Any], Hashable, abc.ABC):
         """
         self.pieces = piece, *pieces
         self._id = _id
-        self._hash = (
-            _hash
-            if _hash is not None
-            else hash(
-                tuple(tuple(item) for piece in self.pieces for item in piece.items())
-            )
-        )
+        self._hash = _hash
 
     def __hash__(self) -> int:
-        return self._hash
+        row_hash = self._hash
+        if row_hash is None:
+            row_hash = self._hash = hash(
+                tuple(tuple(item) for piece in self.pieces for item in piece.items())
+            )
+        return row_hash
 
     def __eq__(self, other: Any) -> bool:
         if isinstance(self, AbstractRow) and isinstance(other, AbstractRow):
@@ -111,6 +110,8 @@ class AbstractRow(Mapping[str, Any], Hashable, abc.ABC):
 class Row(AbstractRow):
     """A concrete :class:`AbstractRow` subclass for single child relations."""
 
+    __slots__ = ()
+
     def merge(self, other: Mapping[str, Any]) -> Row:
         """Combine the :class:`typing.Mapping` `other` with this one.
 
@@ -120,15 +121,22 @@ class Row(AbstractRow):
             Any Mapping whose keys are instances of :class:`str`.
 
         """
-        return type(self)(
-            toolz.merge(self.data, getattr(other, "data", other)), _id=self._id
-        )
+        return type(self)({**self.data, **getattr(other, "data", other)}, _id=self._id)
 
     @property
     def data(self) -> Mapping[str, Any]:
         """Return the underlying mapping of this :class:`Row`."""
         return self.pieces[0]
 
+    def __getitem__(self, column: str) -> Any:
+        # skip the data property, getters call this once per row
+        return self.pieces[0][column]
+
+    def __len__(self) -> int:
+        """Return the number of columns in this row."""
+        # relations check every row's truthiness, which calls this
+        return len(self.pieces[0])
+
     @classmethod
     def from_mapping(cls, mapping: Mapping[str, Any], *, _id: int = -1) -> AbstractRow:
         """Construct a Row instance from any mapping with string keys.
@@ -141,11 +149,14 @@ class Row(AbstractRow):
             A new row id for the returned :class:`Row` instance.
 
         """
-        return (
-            mapping._renew_id(_id)
-            if isinstance(mapping, AbstractRow)
-            else cls(getattr(mapping, "data", mapping), _id=_id)
-        )
+        # check for the common concrete types first, isinstance checks
+        # against abstract base classes are comparatively slow
+        mapping_type = type(mapping)
+        if mapping_type is dict:
+            return cls(mapping, _id=_id)
+        if mapping_type is cls or isinstance(mapping, AbstractRow):
+            return typing.cast(AbstractRow, mapping)._renew_id(_id)
+        return cls(getattr(mapping, "data", mapping), _id=_id)
 
     def __repr__(self) -> str:
         return f"{self.__class__.__name__}({self.data})"
@@ -174,6 +185,8 @@ class JoinedRow(AbstractRow):
 
     """
 
+    __slots__ = "left", "right", "_overlapping_keys", "_data"
+
     def __init__(
         self,
         left: Mapping[str, Any],
@@ -197,7 +210,7 @@ class JoinedRow(AbstractRow):
         self.left = Row.from_mapping(left, _id=_id)
         self.right = Row.from_mapping(right, _id=_id)
         self._overlapping_keys = left.keys() & right.keys()
-        self._data = toolz.merge(left, right)
+        self._data = {**left, **right}
         super().__init__(left, right, _id=_id, _hash=_hash)
 
     @property
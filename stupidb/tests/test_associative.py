@@ -1,5 +1,24 @@
+from __future__ import annotations
+
+import statistics
+from typing import Any
+
+import pytest
+
 from stupidb.associative.segmenttree import SegmentTree
-from stupidb.functions.associative import Count, Mean, Min, SampleCovariance, Sum, Total
+from stupidb.functions.associative import (
+    Count,
+    Max,
+    Mean,
+    Min,
+    PopulationStandardDeviation,
+    PopulationVariance,
+    SampleCovariance,
+    SampleStandardDeviation,
+    SampleVariance,
+    Sum,
+    Total,
+)
 
 
 def test_repr_segment_tree_fanout_2() -> None:
@@ -73,6 +92,201 @@ def test_sample_covariance_repr() -> None:
     cov = SampleCovariance[float, float]()
     assert repr(cov) == "SampleCovariance(mean_x=0.0, mean_y=0.0, cov=0.0, count=0)"
     cov.step(1.0, 2.0)
-    assert repr(cov) == "SampleCovariance(mean_x=2.0, mean_y=2.0, cov=0.0, count=1)"
+    assert repr(cov) == "SampleCovariance(mean_x=1.0, mean_y=2.0, cov=0.0, count=1)"
     cov.step(3.0, 4.5)
-    assert repr(cov) == "SampleCovariance(mean_x=5.0, mean_y=3.25, cov=1.25, count=2)"
+    assert repr(cov) == "SampleCovariance(mean_x=2.0, mean_y=3.25, cov=2.5, count=2)"
+
+
+@pytest.mark.parametrize(  # type: ignore[misc]
+    "aggregate_type",
+    [Count, Sum, Total, Mean, Min, Max, SampleVariance, PopulationStandardDeviation],
+)
+@pytest.mark.parametrize(  # type: ignore[misc]
+    "values", [[], [None], [3, None, -1, 2.5, None, 7], [None, 4, 4, 1]]
+)
+def test_step_batch(aggregate_type: type, values: list[Any]) -> None:
+    stepped = aggregate_type()
+    for value in values:
+        stepped.step(value)
+
+    batched = aggregate_type()
+    batched.step_batch(values)
+
+    # generators must work too
+    generated = aggregate_type()
+    generated.step_batch(value for value in values)
+
+    assert generated.finalize() == stepped.finalize()
+
+    assert batched.finalize() == stepped.finalize()
+
+
+@pytest.mark.parametrize("aggregate_type", [Min, Max])  # type: ignore[misc]
+def test_min_max_step_batch_keeps_state(aggregate_type: type) -> None:
+    stepped = aggregate_type()
+    for value in [5, None, 2, 9]:
+        stepped.step(value)
+
+    batched = aggregate_type()
+    batched.step_batch([5, None])
+    batched.step_batch([None])
+    batched.step_batch([2, 9])
+    assert batched.finalize() == stepped.finalize()
+
+
+def test_covariance_step_batch() -> None:
+    xs = [1, None, 3.5, -2, 4]
+    ys = [2.0, 1, None, 7, 0.5]
+
+    stepped: SampleCovariance[Any, Any] = SampleCovariance()
+    for x, y in zip(xs, ys):
+        stepped.step(x, y)
+
+    batched: SampleCovariance[Any, Any] = SampleCovariance()
+    batched.step_batch(xs, ys)
+    assert repr(batched) == repr(stepped)
+
+
+def test_sample_covariance_matches_two_pass() -> None:
+    xs = [1.5, -3.0, 4.25, 10.0, 2.0, 0.5, -7.75]
+    ys = [2.0, 8.5, -1.0, 3.25, 6.0, -4.5, 0.0]
+    n = len(xs)
+    mean_x = sum(xs) / n
+    mean_y = sum(ys) / n
+    expected = sum((x - mean_x) * (y - mean_y) for x, y in zip(xs, ys)) / (n - 1)
+
+    stepped: SampleCovariance[Any, Any] = SampleCovariance()
+    for x, y in zip(xs, ys):
+        stepped.step(x, y)
+    assert stepped.finalize() == pytest.approx(expected)
+
+    left: SampleCovariance[Any, Any] = SampleCovariance()
+    left.step_batch(xs[:3], ys[:3])
+    right: SampleCovariance[Any, Any] = SampleCovariance()
+    right.step_batch(xs[3:], ys[3:])
+    left.combine(right)
+    assert left.finalize() == pytest.approx(expected)
+
+
+def test_sum_is_compensated() -> None:
+    values = [1e16, 1.0, -1e16, 3.0]
+
+    stepped: Sum[Any, Any] = Sum()
+    for value in values:
+        stepped.step(value)
+    assert stepped.finalize() == 4.0
+
+    left: Sum[Any, Any] = Sum()
+    left.step_batch(values[:1])
+    right: Sum[Any, Any] = Sum()
+    right.step_batch(values[1:2])
+    left.combine(right)
+    left.step(values[2])
+    left.step_batch(values[3:])
+    assert left.finalize() == 4.0
+
+    tree: SegmentTree[Any, Any, Any] = SegmentTree(
+        [(value,) for value in values], aggregate_type=Sum, fanout=2
+    )
+    assert tree.query(0, len(values)) == 4.0
+    assert tree.query(0, 3) == 1.0
+
+
+@pytest.mark.parametrize("fanout", [2, 3, 4])  # type: ignore[misc]
+@pytest.mark.parametrize("number_of_leaves", [1, 5, 16, 17])  # type: ignore[misc]
+def test_segment_tree_partially_filled(fanout: int, number_of_leaves: int) -> None:
+    values = [float(value) ** 1.5 for value in range(number_of_leaves)]
+    tree: SegmentTree[Any, Any, Any] = SegmentTree(
+        [(value,) for value in values], aggregate_type=SampleVariance, fanout=fanout
+    )
+    for begin in range(number_of_leaves):
+        for end in range(begin + 2, number_of_leaves + 1):
+            assert tree.query(begin, end) == pytest.approx(
+                statistics.variance(values[begin:end])
+            )
+
+
+def test_variance_matches_statistics() -> None:
+    values = [4.5, None, -2.0, 7.25, 0.0, None, 3.5, 11.0]
+    present = [value for value in values if value is not None]
+
+    sample: SampleVariance[Any] = SampleVariance()
+    for value in values:
+        sample.step(value)
+    assert sample.finalize() == pytest.approx(statistics.variance(present))
+
+    left: PopulationVariance[Any] = PopulationVariance()
+    left.step_batch(values[:3])
+    right: PopulationVariance[Any] = PopulationVariance()
+    right.step_batch(values[3:])
+    left.combine(right)
+    assert left.finalize() == pytest.approx(statistics.pvariance(present))
+
+    empty: PopulationVariance[Any] = PopulationVariance()
+    empty.combine(PopulationVariance())
+    assert empty.finalize() is None
+
+
+def test_covariance_combine_empty() -> None:
+    empty: SampleCovariance[Any, Any] = SampleCovariance()
+    empty.combine(SampleCovariance())
+    assert repr(empty) == "SampleCovariance(mean_x=0.0, mean_y=0.0, cov=0.0, count=0)"
+
+    cov: SampleCovariance[Any, Any] = SampleCovariance()
+    cov.step_batch([1.0, 3.0], [2.0, 4.5])
+    cov.combine(empty)
+    assert repr(cov) == "SampleCovariance(mean_x=2.0, mean_y=3.25, cov=2.5, count=2)"
+    empty.combine(cov)
+    assert repr(empty) == repr(cov)
+
+
+@pytest.mark.parametrize(  # type: ignore[misc]
+    "aggregate_type",
+    [
+        Count,
+        Sum,
+        Total,
+        Mean,
+        Min,
+        Max,
+        SampleCovariance,
+        SampleVariance,
+        SampleStandardDeviation,
+        PopulationStandardDeviation,
+    ],
+)
+def test_slots_are_not_redeclared(aggregate_type: type) -> None:
+    slots = [
+        slot
+        for cls in aggregate_type.__mro__
+        for slot in cls.__dict__.get("__slots__", ())
+    ]
+    assert len(slots) == len(set(slots))
+    assert not hasattr(aggregate_type(), "__dict__")
+
+
+@pytest.mark.parametrize(  # type: ignore[misc]
+    ("aggregate_type", "reduce"), [(Min, min), (Max, max)]
+)
+def test_min_max_segment_tree(aggregate_type: type, reduce: Any) -> None:
+    values = [3, None, -1, 7, None, None, 2, 7, -1, 5]
+    tree: SegmentTree[Any, Any, Any] = SegmentTree(
+        [(value,) for value in values], aggregate_type=aggregate_type, fanout=3
+    )
+    for begin in range(len(values)):
+        for end in range(begin + 1, len(values) + 1):
+            present = [value for value in values[begin:end] if value is not None]
+            expected = reduce(present) if present else None
+            assert tree.query(begin, end) == expected
+
+
+def test_segment_tree_nodes_are_distinct() -> None:
+    # 17 leaves with fanout 4 populate 17 + 5 + 2 + 1 nodes of the 85, the
+    # rest are empty, but each node is its own aggregate
+    tree: SegmentTree[Any, Any, Any] = SegmentTree(
+        [(value,) for value in range(17)], aggregate_type=Sum, fanout=4
+    )
+    assert len(tree.nodes) == 85
+    assert len(set(map(id, tree.nodes))) == 85
+    assert sum(node.count == 0 for node in tree.nodes) == 85 - (17 + 5 + 2 + 1)
+    assert tree.query(0, 17) == sum(range(17))
@@ -133,3 +133,36 @@ def test_lead_lag(t_rows: list[dict[str, Element]]) -> None:
         dict(lead_date=None, lag_date=date(2018, 1, 3)),
     ]
     assert_rowset_equal(result, expected)
+
+
+def test_lead_lag_defaults(t_rows: list[dict[str, Element]]) -> None:
+    window = Window.range(partition_by=[get("name")])
+    query = table(t_rows) >> select(
+        lead_date=lead(get("date")) >> over(window),
+        lag_date=lag(get("date"), default=const(date(2000, 1, 1))) >> over(window),
+    )
+    result = list(query)
+    expected: list[Mapping[str, Element]] = [
+        dict(lead_date=date(2018, 1, 4), lag_date=date(2000, 1, 1)),
+        dict(lead_date=date(2018, 1, 6), lag_date=date(2018, 1, 1)),
+        dict(lead_date=date(2018, 1, 7), lag_date=date(2018, 1, 4)),
+        dict(lead_date=None, lag_date=date(2018, 1, 6)),
+        dict(lead_date=date(2018, 1, 3), lag_date=date(2000, 1, 1)),
+        dict(lead_date=date(2018, 1, 4), lag_date=date(2018, 1, 2)),
+        dict(lead_date=None, lag_date=date(2018, 1, 3)),
+    ]
+    assert_rowset_equal(result, expected)
+
+
+def test_lead_lag_shift_matches_offsets(t_rows: list[dict[str, Element]]) -> None:
+    window = Window.range(partition_by=[get("name")])
+    default = const(date(2000, 1, 1))
+    shifted = table(t_rows) >> select(
+        lead_date=lead(get("date"), default=default) >> over(window),
+        lag_date=lag(get("date"), default=default) >> over(window),
+    )
+    offset = table(t_rows) >> select(
+        lead_date=lead(get("date"), const(1), default) >> over(window),
+        lag_date=lag(get("date"), const(1), default) >> over(window),
+    )
+    assert list(shifted) == list(offset)
@@ -1,3 +1,7 @@
+from __future__ import annotations
+
+from types import MappingProxyType
+
 import pytest
 
 from stupidb.row import JoinedRow, Row
@@ -38,6 +42,42 @@ def test_hash_after_renew_id() -> None:
     assert hash(row1) == hash(row2)
 
 
+def test_row_hash_is_lazy() -> None:
+    row = Row({"a": [1, 2]}, _id=0)
+    assert row.a == [1, 2]
+    with pytest.raises(TypeError, match="unhashable"):
+        hash(row)
+
+    row = Row({"a": 1}, _id=0)
+    assert row._hash is None
+    assert hash(row) == hash(row._renew_id(id=1))
+    assert row._hash is not None
+
+
+@pytest.mark.parametrize(  # type: ignore[misc]
+    "row", [Row({"a": 1}), JoinedRow({"a": 1}, {"b": 2})]
+)
+def test_rows_are_slotted(row: Row | JoinedRow) -> None:
+    assert not hasattr(row, "__dict__")
+    with pytest.raises(AttributeError):
+        row.extra = 1  # type: ignore[union-attr]
+
+
+def test_row_from_mapping() -> None:
+    data = {"a": 1}
+    row = Row.from_mapping(data, _id=2)
+    assert row.data is data
+    assert row._id == 2
+    assert len(row) == 1
+
+    assert Row.from_mapping(row, _id=2) is row
+    assert Row.from_mapping(row, _id=3)._id == 3
+
+    joined = JoinedRow({"a": 1}, {"b": 2}, _id=0)
+    assert type(Row.from_mapping(joined, _id=1)) is JoinedRow
+    assert Row.from_mapping(MappingProxyType(data)).data == data
+
+
 def test_joined_row_data() -> None:
     row = JoinedRow({"a": 1}, {"b": 2}, _id=0)
     assert row.data == {"a": 1, "b": 2}
@@ -1,12 +1,21 @@
+from __future__ import annotations
+
+from typing import Any, Callable
+
+import pytest
+
 from stupidb.api import (
     difference,
     difference_all,
     intersect,
     intersect_all,
     order_by,
+    sift,
+    table,
     union,
     union_all,
 )
+from stupidb.core import Selection, SetOperation
 
 from .conftest import assert_rowset_equal
 
@@ -118,3 +127,52 @@ def test_difference_all_duplicates() -> None:
     result = list(query)
     expected = [dict(name="b"), dict(name="b")]
     assert result == expected
+
+
+@pytest.mark.parametrize(  # type: ignore[misc]
+    "operation",
+    [union, union_all, intersect, intersect_all, difference, difference_all],
+)
+def test_sift_pushed_into_set_operation(operation: Callable[..., Any]) -> None:
+    rows = [dict(name="a"), dict(name="b"), dict(name="b"), dict(name="d")]
+    other_rows = [dict(name="b"), dict(name="c"), dict(name="d")]
+    query = table(rows) >> operation(table(other_rows)) >> sift(lambda r: r.name > "a")
+    assert isinstance(query, SetOperation)
+    assert isinstance(query.left, Selection)
+    assert isinstance(query.right, Selection)
+
+    expected = Selection(
+        table(rows) >> operation(table(other_rows)), lambda r: r.name > "a"
+    )
+    assert_rowset_equal(list(query), list(expected))
+
+    unpushed = rows >> operation(other_rows) >> sift(lambda r: r.name > "a")
+    assert isinstance(unpushed, Selection)
+
+
+def test_sift_not_pushed_into_set_operation() -> None:
+    rows = [dict(name="a"), dict(name="b")]
+    other_rows = [dict(name="c")]
+    query = (
+        table(rows) >> union(table(other_rows)) >> sift(lambda r: r.name.upper() > "A")
+    )
+    assert isinstance(query, Selection)
+    result = list(query >> order_by(lambda r: r.name))
+    assert result == [dict(name="b"), dict(name="c")]
+
+
+@pytest.mark.parametrize(  # type: ignore[misc]
+    ("operation", "expected"),
+    [
+        (union, [dict(name="a"), dict(name="b")]),
+        (intersect, [dict(name="a"), dict(name="b")]),
+        (difference, []),
+        (difference_all, []),
+    ],
+)
+def test_set_operation_with_itself(
+    operation: Callable[..., Any], expected: list[dict[str, Any]]
+) -> None:
+    t = table([dict(name="a"), dict(name="b"), dict(name="a")])
+    query = t >> operation(t)
+    assert_rowset_equal(query, expected)
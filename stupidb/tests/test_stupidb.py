@@ -3,7 +3,9 @@
 from __future__ import annotations
 
 import builtins
+import inspect
 import itertools
+import math
 import operator
 import sqlite3
 import statistics
@@ -11,7 +13,6 @@ from datetime import date, timedelta
 from typing import Any, Callable, Iterable, Iterator, Mapping, Sequence, TypeVar
 
 import pytest
-import toolz
 
 from stupidb.aggregation import Window
 from stupidb.api import (
@@ -22,6 +23,7 @@ from stupidb.api import (
     cov_samp,
     cross_join,
     exists,
+    first,
     full_join,
     get,
     group_by,
@@ -35,6 +37,7 @@ from stupidb.api import (
     nth,
     order_by,
     over,
+    pipe,
     pretty,
     right_join,
     select,
@@ -47,7 +50,15 @@ from stupidb.api import (
     var_pop,
     var_samp,
 )
-from stupidb.core import Relation, Table
+from stupidb.core import (
+    ColumnarTable,
+    GroupBy,
+    Join,
+    Mutate,
+    Projection,
+    Relation,
+    Table,
+)
 from stupidb.row import Row
 
 from .conftest import Element, assert_rowset_equal
@@ -203,6 +214,79 @@ ON t.z = s.z"""
     assert_rowset_equal(result, expected)
 
 
+def test_equi_join_keys() -> None:
+    nan = float("nan")
+    left_rows = [dict(a=1), dict(a=None), dict(a=nan), dict(a=2)]
+    right_rows = [dict(b=2), dict(b=None), dict(b=nan), dict(b=1.0), dict(b=2)]
+    join = table(left_rows) >> inner_join(
+        table(right_rows), lambda left, right: left.a == right.b
+    )
+    assert [(row.left.a, row.right.b) for row in join] == [
+        (1, 1.0),
+        (None, None),
+        (2, 2),
+        (2, 2),
+    ]
+
+
+# both sides have a column named k, since right joins call the join predicate
+# with their arguments swapped
+JOIN_LEFT = [dict(k=1, x="p"), dict(k=2, x="q"), dict(k=3, x="r")]
+JOIN_RIGHT = [dict(k=1, y="s"), dict(k=3, y="t"), dict(k=4, y="u")]
+
+
+@pytest.mark.parametrize(  # type: ignore[misc]
+    ("join", "predicate", "pushed"),
+    [
+        (inner_join, lambda r: r.left.x != "r", True),
+        (inner_join, lambda r: r.right["y"] == "t", True),
+        (left_join, lambda r: r.left.x != "r", True),
+        (left_join, lambda r: r.right.y is None, False),
+        (right_join, lambda r: r.right.y != "t", True),
+        (right_join, lambda r: r.left.x is None, False),
+        (inner_join, lambda r: r.left.k < r.right.k, False),
+        (inner_join, lambda r: r.left.x != r.right.y, False),
+    ],
+)
+def test_sift_pushed_into_join(
+    join: Callable[..., Any], predicate: Callable[[Any], Any], pushed: bool
+) -> None:
+    def joined() -> Relation:
+        return table(JOIN_LEFT) >> join(
+            table(JOIN_RIGHT), lambda left, right: left.k == right.k
+        )
+
+    result = joined() >> sift(predicate)
+    assert isinstance(result, Join) == pushed
+    expected = [row for row in joined() if predicate(row)]
+    assert [(row.left.data, row.right.data) for row in result] == [
+        (row.left.data, row.right.data) for row in expected
+    ]
+
+
+def test_sift_pushed_below_group_by() -> None:
+    rows = [dict(g=i % 2, x=i) for i in range(6)]
+    query = table(rows) >> group_by(g=get("g")) >> sift(lambda r: r.x > 1)
+    assert isinstance(query, GroupBy)
+    assert list(query >> aggregate(s=sum(get("x")))) == [
+        dict(g=0, s=6),
+        dict(g=1, s=8),
+    ]
+
+
+def test_left_join_duplicate_unmatched_rows() -> None:
+    left_rows = [dict(a=1), dict(a=1), dict(a=2)]
+    right_rows = [dict(b=2)]
+    join = table(left_rows) >> left_join(
+        table(right_rows), lambda left, right: left.a == right.b
+    )
+    assert [(row.left.a, row.right.b) for row in join] == [
+        (1, None),
+        (1, None),
+        (2, 2),
+    ]
+
+
 def test_right_join(
     left: list[dict[str, Element]],
     right: list[dict[str, Element]],
@@ -326,6 +410,22 @@ def test_semi_join_not_all_rows_match() -> None:
     assert result == expected
 
 
+def test_exists() -> None:
+    assert exists(table([dict(a=1)]))
+    assert not exists(table([]))
+    assert not exists(table([{}, {}]))
+    assert not exists(table([{}, {}], columnar=True))
+
+    numbers = table([dict(a=1), dict(a=2)], columnar=True)
+    assert exists(numbers >> sift(lambda r: r.a > 1))
+    assert not exists(numbers >> sift(lambda r: r.a > 2))
+
+    # a value the first row doesn't depend on can't make exists fail
+    nullable = table([dict(a=1), dict(a=None)], columnar=True)
+    assert exists(nullable >> mutate(c=lambda r: r.a + 1))
+    assert exists(table(dict(a=i) for i in itertools.count()))
+
+
 @pytest.mark.parametrize("offset", range(4))  # type: ignore[misc]
 @pytest.mark.parametrize("lim", range(4))  # type: ignore[misc]
 def test_valid_limit(rows: Sequence[Mapping[str, Any]], offset: int, lim: int) -> None:
@@ -333,6 +433,12 @@ def test_valid_limit(rows: Sequence[Mapping[str, Any]], offset: int, lim: int) -
     assert list(pipeline) == rows[offset : offset + lim]
 
 
+def test_no_limit(rows: Sequence[Mapping[str, Any]]) -> None:
+    t = table(rows)
+    assert t >> limit(None) is t
+    assert list(table(rows) >> limit(None, offset=2)) == rows[2:]
+
+
 @pytest.mark.parametrize(  # type: ignore[misc]
     ("offset", "lim"),
     ((offset, lim) for lim in range(-2, 1) for offset in range(-2, 1) if offset or lim),
@@ -364,16 +470,16 @@ def test_right_shiftable(rows: list[dict[str, Element]]) -> None:
         {
             "c": 1,
             "mean": -0.5,
-            "my_samp_cov": 15.0,
-            "my_pop_cov": 7.5,
+            "my_samp_cov": 12.5,
+            "my_pop_cov": 6.25,
             "total": -1,
             "z": "a",
         },
         {
             "c": 2,
             "mean": -2.0,
-            "my_samp_cov": 3.0,
-            "my_pop_cov": 1.5,
+            "my_samp_cov": 2.0,
+            "my_pop_cov": 1.0,
             "total": -4,
             "z": "b",
         },
@@ -406,6 +512,32 @@ def test_right_shiftable(rows: list[dict[str, Element]]) -> None:
     assert_rowset_equal(result, expected)
 
 
+def test_pipe(rows: list[dict[str, Element]]) -> None:
+    operations = (
+        sift(lambda r: r.a > 1),
+        mutate(c=lambda r: r.a * r.b),
+        order_by(lambda r: r.c),
+        select(c=lambda r: r.c),
+    )
+    expected = list(
+        table(rows)
+        >> sift(lambda r: r.a > 1)
+        >> mutate(c=lambda r: r.a * r.b)
+        >> order_by(lambda r: r.c)
+        >> select(c=lambda r: r.c)
+    )
+    assert list(pipe(table(rows), *operations)) == expected
+
+    t = table(rows)
+    assert pipe(t) is t
+
+
+def test_shiftable_signature() -> None:
+    signature = inspect.signature(limit)
+    assert list(signature.parameters) == ["limit", "relation", "offset"]
+    assert inspect.signature(limit(1)) is signature
+
+
 def test_rows_window(rows: list[dict[str, Element]]) -> None:
     pipeline = (
         table(rows)
@@ -433,7 +565,7 @@ def test_rows_window(rows: list[dict[str, Element]]) -> None:
         {"my_agg": 7},
     ]
     expected = sorted(
-        map(toolz.merge, rows, expected_aggrows),
+        ({**row, **aggrow} for row, aggrow in zip(rows, expected_aggrows)),
         key=lambda r: (r["z"], r["e"]),
     )
     assert len(result) == len(expected)
@@ -461,7 +593,7 @@ def test_rows_window_partition(rows: list[dict[str, Element]]) -> None:
     assert len(result) == len(rows)
     assert len(result) == len(expected_aggrows)
     expected = sorted(
-        map(toolz.merge, rows, expected_aggrows),
+        ({**row, **aggrow} for row, aggrow in zip(rows, expected_aggrows)),
         key=lambda r: (r["z"], r["e"]),
     )
     assert len(result) == len(expected)
@@ -588,6 +720,66 @@ def test_temporal_range_window(
     assert_rowset_equal(result, expected)
 
 
+def test_window_key_columns(t_rows: list[dict[str, Element]]) -> None:
+    by_column = mean(get("balance")) >> over(
+        Window.range(
+            order_by=[lambda r: r.date],
+            partition_by=[get("name")],
+            preceding=lambda r: timedelta(days=3),
+        )
+    )
+    assert by_column.partition_by_columns == ["name"]
+    assert by_column.order_by_columns == ["date"]
+
+    by_function = mean(get("balance")) >> over(
+        Window.range(
+            order_by=[lambda r: r.date + timedelta(0)],
+            partition_by=[lambda r: r.name.lower()],
+            preceding=lambda r: timedelta(days=3),
+        )
+    )
+    assert by_function.partition_by_columns is None
+    assert by_function.order_by_columns is None
+
+    expected = list(table(t_rows) >> mutate(avg_balance=by_function))
+    assert list(table(t_rows) >> mutate(avg_balance=by_column)) == expected
+
+
+def test_whole_partition_window(rows: list[dict[str, Element]]) -> None:
+    whole = Window.rows(partition_by=[get("z")])
+    bounded = Window.rows(
+        partition_by=[get("z")], preceding=lambda r: 100, following=lambda r: 100
+    )
+    query = table(rows) >> mutate(
+        total=sum(get("a")) >> over(whole),
+        cov=cov_samp(get("a"), get("b")) >> over(whole),
+        first_e=first(get("e")) >> over(whole),
+    )
+    expected = table(rows) >> mutate(
+        total=sum(get("a")) >> over(bounded),
+        cov=cov_samp(get("a"), get("b")) >> over(bounded),
+        first_e=first(get("e")) >> over(bounded),
+    )
+    result = list(query)
+    expected_rows = list(expected)
+    # the whole partition is aggregated in one pass rather than through a
+    # segment tree, so floating point results can differ in the last place
+    assert [row.total for row in result] == [row.total for row in expected_rows]
+    assert [row.first_e for row in result] == [row.first_e for row in expected_rows]
+    assert [row.cov for row in result] == pytest.approx(
+        [row.cov for row in expected_rows]
+    )
+    assert [row.total for row in result] == [9, 7, 9, 9, 9, 7, 7]
+
+
+def test_range_window_without_order_by() -> None:
+    # without an ORDER BY every row in a partition is a peer of the current row
+    rows = [dict(x=x) for x in range(4)]
+    window = Window.range(following=lambda r: 0)
+    query = table(rows) >> select(total=sum(get("x")) >> over(window))
+    assert [row.total for row in query] == [6, 6, 6, 6]
+
+
 def test_agg(rows: list[dict[str, Element]]) -> None:
     pipeline = table(rows) >> aggregate(
         sum=sum(lambda r: r["e"]),
@@ -599,8 +791,143 @@ def test_agg(rows: list[dict[str, Element]]) -> None:
     assert result["mean"] == result["sum"] / result["count"]
 
 
+def test_table_columnar_detection(rows: list[dict[str, Element]]) -> None:
+    numeric = [dict(a=1, b=2.5), dict(a=2, b="x")]
+    assert isinstance(table(numeric), ColumnarTable)
+    assert isinstance(table(tuple(numeric)), ColumnarTable)
+    # iterators are consumed lazily
+    assert isinstance(table(iter(numeric)), Table)
+    assert isinstance(table(row for row in numeric), Table)
+    assert isinstance(table(numeric, columnar=False), Table)
+    assert isinstance(table(rows), ColumnarTable)
+    assert isinstance(table([dict(a="x", b=None, c=date(2018, 1, 1))]), ColumnarTable)
+    assert isinstance(table([dict(a=1, b=[2])]), Table)
+    assert isinstance(table([dict(a=1), dict(b=2)]), Table)
+    assert isinstance(table([]), Table)
+
+    with pytest.raises(ValueError):
+        table([dict(a=1), dict(b=2)], columnar=True)
+    with pytest.raises(ValueError):
+        table([dict(a=1), dict(a=2, b=3)], columnar=True)
+    assert isinstance(table([dict(a=1, b=2), dict(b=3, a=4)]), ColumnarTable)
+
+
+def test_table_consumes_iterators_lazily() -> None:
+    unbounded = table(dict(a=i) for i in itertools.count())
+    assert list(unbounded >> limit(3)) == [dict(a=0), dict(a=1), dict(a=2)]
+
+    consumed = []
+
+    def generate() -> Iterator[dict[str, int]]:
+        for i in range(10):
+            consumed.append(i)
+            yield dict(a=i)
+
+    assert next(iter(table(generate()))) == dict(a=0)
+    assert consumed == [0]
+
+
+def test_columnar_table(rows: list[dict[str, Element]]) -> None:
+    t = table(rows, columnar=True)
+    assert isinstance(t, ColumnarTable)
+    assert list(t) == rows
+    # columnar tables can be iterated over more than once
+    assert list(t) == rows
+
+
+@pytest.mark.parametrize("columnar", [False, True])  # type: ignore[misc]
+def test_columnar_agg(rows: list[dict[str, Element]], columnar: bool) -> None:
+    pipeline = table(rows, columnar=columnar) >> aggregate(
+        sum=sum(get("e")),
+        mean=mean(get("e")),
+        count=count(get("z")),
+        min=min(get("b")),
+        max=max(get("a")),
+        cov=cov_pop(get("a"), get("b")),
+    )
+    expected = table(rows, columnar=False) >> aggregate(
+        sum=sum(lambda r: r["e"]),
+        mean=mean(lambda r: r["e"]),
+        count=count(lambda r: r["z"]),
+        min=min(lambda r: r["b"]),
+        max=max(lambda r: r["a"]),
+        cov=cov_pop(lambda r: r["a"], lambda r: r["b"]),
+    )
+    assert list(pipeline) == list(expected)
+
+
+def test_columnar_agg_fallback(rows: list[dict[str, Element]]) -> None:
+    t = table(rows, columnar=True)
+    (result,) = t >> aggregate(sum=sum(get("e")), total=total(lambda r: r["a"] + 0))
+    assert result == dict(sum=28, total=16)
+    assert not list(table([], columnar=True) >> aggregate(sum=sum(get("e"))))
+
+
+@pytest.mark.parametrize("outer", [Projection, Mutate])  # type: ignore[misc]
+@pytest.mark.parametrize("inner", [Projection, Mutate])  # type: ignore[misc]
+def test_fused_projections(
+    rows: list[dict[str, Element]], inner: type[Projection], outer: type[Projection]
+) -> None:
+    inner_projections = dict(a=get("a"), f=lambda r: r.e * 2)
+    outer_projections = dict(x=get("f"), a=lambda r: r.a)
+    t = table(rows)
+    fused = outer.fused(inner(t, inner_projections), outer_projections)
+    assert fused.child is t
+    expected = outer(inner(table(rows), inner_projections), outer_projections)
+    assert list(fused) == list(expected)
+
+
+def test_fused_independent_projections(rows: list[dict[str, Element]]) -> None:
+    t = table(rows)
+    mutated = t >> mutate(f=lambda r: r.e * 2) >> mutate(g=lambda r: r.e + r.a)
+    assert isinstance(mutated, Mutate)
+    assert mutated.child is t
+    expected = table(rows) >> mutate(f=lambda r: r.e * 2, g=lambda r: r.e + r.a)
+    assert list(mutated) == list(expected)
+
+    t = table(rows)
+    selected = t >> mutate(f=lambda r: r.e * 2) >> select(g=lambda r: r.e + 1)
+    assert type(selected) is Projection
+    assert selected.child is t
+    assert [row.g for row in selected] == [2, 3, 4, 5, 6, 7, 8]
+
+    t = table(rows)
+    dependent = t >> mutate(f=lambda r: r.e * 2) >> mutate(g=lambda r: r.f + 1)
+    assert dependent.child.child is t
+    assert [row.g for row in dependent] == [3, 5, 7, 9, 11, 13, 15]
+
+
+def test_column_projections(rows: list[dict[str, Element]]) -> None:
+    t = table(rows, columnar=False)
+    result = list(t >> select(e=lambda r: r.e, z=lambda r: r["z"]))
+    assert result == [dict(e=row["e"], z=row["z"]) for row in rows]
+
+    joined = table([dict(x=1)]) >> cross_join(table([dict(y=2), dict(y=3)]))
+    assert list(joined >> select(y=lambda r: r.y, x=lambda r: r.x)) == [
+        dict(y=2, x=1),
+        dict(y=3, x=1),
+    ]
+
+    overlapping = table([dict(x=1)]) >> cross_join(table([dict(x=2)]))
+    with pytest.raises(ValueError, match="overlapping columns"):
+        list(overlapping >> select(x=lambda r: r["x"]))
+
+
+def test_unfused_projections(rows: list[dict[str, Element]]) -> None:
+    t = table(rows)
+    computed = t >> mutate(f=lambda r: r.e * 2) >> select(g=lambda r: r.f + 1)
+    assert computed.child.child is t
+    assert [row.g for row in computed] == [3, 5, 7, 9, 11, 13, 15]
+
+    t = table(rows)
+    missing = t >> select(a=lambda r: r.a) >> select(e=lambda r: r.e)
+    assert missing.child.child is t
+    with pytest.raises(AttributeError):
+        list(missing)
+
+
 def test_invalid_agg(rows: list[dict[str, Element]]) -> None:
-    with pytest.raises(TypeError, match="Invalid projection"):
+    with pytest.raises(TypeError, match="Invalid projection: 'my_agg'"):
         select(
             not_an_agg=lambda r: r["e"],
             my_agg=sum(lambda r: r["e"]),
@@ -757,6 +1084,23 @@ def test_pretty_fmt(t_rows):
     assert result == expected
 
 
+@pytest.mark.parametrize(
+    "rows",
+    [
+        [dict(a=1, b="x"), dict(a=2.5, b=None), dict(b=" y ", c=1e20)],
+        # columns the simple formatter doesn't handle fall back to tabulate
+        [dict(a=True, b="1.5"), dict(a=float("nan"), b="é")],
+        [dict(a=1, b="x\ny")],
+    ],
+)
+def test_pretty_matches_tabulate(rows: list[dict[str, Any]]) -> None:
+    tabulate = pytest.importorskip("tabulate")
+    expected = tabulate.tabulate(
+        [Row.from_mapping(row) for row in rows], headers="keys"
+    )
+    assert table(rows) >> pretty() == expected
+
+
 def test_multiple_windows(t_rows: list[dict[str, Element]]) -> None:
     query = table(t_rows) >> select(
         nth_date=(
@@ -778,3 +1122,41 @@ def test_multiple_windows(t_rows: list[dict[str, Element]]) -> None:
         dict(nth_date=date(2018, 1, 3), max_balance=-1),
     ]
     assert_rowset_equal(result, expected)
+
+
+@pytest.mark.parametrize("columnar", [False, True])  # type: ignore[misc]
+@pytest.mark.parametrize(  # type: ignore[misc]
+    ("values", "expected_sum", "expected_mean"),
+    [
+        ([math.inf, 1.0], math.inf, math.inf),
+        ([1.0, -math.inf, 2.0], -math.inf, -math.inf),
+        ([1e100, 1.0, -1e100], 1.0, 1.0 / 3),
+    ],
+)
+def test_sum_is_compensated_on_every_path(
+    columnar: bool, values: list[float], expected_sum: float, expected_mean: float
+) -> None:
+    rows = [dict(x=value) for value in values]
+    query = table(rows, columnar=columnar) >> aggregate(
+        s=sum(get("x")), m=mean(get("x"))
+    )
+    (result,) = query
+    assert result.s == expected_sum
+    assert result.m == expected_mean
+
+    window = Window.rows(partition_by=[get("x")])
+    windowed = list(
+        table(rows, columnar=columnar)
+        >> select(
+            s=sum(get("x")) >> over(Window.rows()), t=sum(get("x")) >> over(window)
+        )
+    )
+    assert [row.s for row in windowed] == [expected_sum] * len(values)
+    assert [row.t for row in windowed] == values
+
+
+def test_sum_of_opposite_infinities_is_nan() -> None:
+    rows = [dict(x=math.inf), dict(x=-math.inf)]
+    for columnar in (False, True):
+        (result,) = table(rows, columnar=columnar) >> aggregate(s=sum(get("x")))
+        assert math.isnan(result.s)